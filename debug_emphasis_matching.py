@@ -3,7 +3,8 @@
 
 import re
 import sys
-from difflib import SequenceMatcher
+
+from rapidfuzz.distance import Indel
 
 import config
 
@@ -68,7 +69,9 @@ def find_text_in_content(needle, haystack):
 
     for i in range(len(haystack_words) - needle_len + 1):
         window = " ".join(haystack_words[i : i + needle_len])
-        ratio = SequenceMatcher(None, needle_normalized, window).ratio()
+        # Indel similarity is Levenshtein.ratio: a C-level, bit-parallel
+        # stand-in for difflib's pure-Python ratio().
+        ratio = Indel.normalized_similarity(needle_normalized, window)
 
         if ratio > best_ratio:
             best_ratio = ratio
@@ -17,7 +17,8 @@ from transcript_utils import (
     create_system_message_with_cache,
     extract_bowen_references,
     extract_section,
-    find_text_in_content,
+    find_text_in_normalized,
+    normalize_text,
     parse_filename_metadata,
     parse_scored_emphasis_output,
     setup_logging,
@@ -634,15 +635,18 @@ def extract_bowen_references_from_transcript(
         )
         filtered_refs = _rule_filter_bowen_references(filtered_refs, logger)
 
+        # Normalize the transcript once; both grounding passes search it.
+        transcript_norm = normalize_text(transcript_text, aggressive=True)
+
         def _ground_refs(refs: list[tuple[str, str]]) -> list[tuple[str, str]]:
             grounded = []
             for concept, quote in refs:
                 compact_quote = _compact_bowen_quote(quote, max_words=140)
-                _, _, ratio_compact = find_text_in_content(
-                    compact_quote, transcript_text, aggressive_normalization=True
+                _, _, ratio_compact = find_text_in_normalized(
+                    normalize_text(compact_quote, aggressive=True), transcript_norm
                 )
-                _, _, ratio_full = find_text_in_content(
-                    quote, transcript_text, aggressive_normalization=True
+                _, _, ratio_full = find_text_in_normalized(
+                    normalize_text(quote, aggressive=True), transcript_norm
                 )
                 ratio = max(ratio_compact, ratio_full)
                 if ratio >= 0.90:
@@ -23,11 +23,81 @@ from transcript_utils import (
     validate_input_file,
 )
 
+_SIC_ANNOTATION_RE = re.compile(r"\s*\[sic\](?:\s*\([^)]*\))?\s*")
+
+# Cleanup applied by validate_format before the word-level comparison,
+# compiled once at import. Speaker/timestamp stamps and the "Transcribed by"
+# footer are stripped in one pass; a footer directly after a stamp is
+# consumed with it, as it would be once the stamp had been removed.
+_RAW_STAMP_OR_FOOTER_RE = re.compile(
+    r"^\s*(?:(?:\[[\d:.]+\]\s+[^:]+:|Unknown Speaker|Speaker \d+)\s+\d+:\d+(?::\d+)?"
+    r"(?:\s*Transcribed by\b.*)?"
+    r"|Transcribed by\b.*)",
+    re.MULTILINE,
+)
+_RAW_CLOCK_RE = re.compile(
+    r"[\[\(]?\b\d+:\d{2}(?::\d{2})?(?:[ap]m)?[\]\)]?", re.IGNORECASE
+)
+_RAW_BARE_SECONDS_RE = re.compile(r"(?:^|\s)[\[\(]?:\d{2}\b[\]\)]?")
+# Procedural speech the formatting model commonly removes from the raw text
+_RAW_PROCEDURAL_RES = [
+    re.compile(p, re.IGNORECASE | re.MULTILINE)
+    for p in (
+        r"\bnext slide(?:,? please)?\.?",
+        r"\bnext one(?:,? please)?\.?",
+        r"\bslide please\.?",
+        r"\bintro\b",
+        r"(?:^|[\.\!\?]\s+)so(?:,)?\s+",  # Sentence-starting 'So'
+        r"(?:^|[\.\!\?]\s+)okay(?:,)?\s+",  # Sentence-starting 'Okay'
+        r"(?:^|[\.\!\?]\s+)right(?:,)?\s+",  # Sentence-starting 'Right'
+        r"\bjust to emphasize(?: this)?",
+        r"\bone please",
+        r"\bthere you see",
+        r"\bthanks\.?",
+        r"\bnext(?:,)?\s+",
+        r"\bone(?:,)?\s+",
+        r"\bslide(?:,)?\s+",
+        r"\bplease\.?",
+    )
+]
+# A [sic] note in the formatted text, minus the whitespace run before it.
+_FORMATTED_SIC_NOTE_RE = re.compile(r"\[sic\](?: \([^)]+\))?")
+_FORMATTED_SPEAKER_RE = re.compile(r"\*\*[^*]+:\*\*\s*")
+_FORMATTED_HEADING_RE = re.compile(r"^\s*#+.*$", re.MULTILINE)
+
+
+def _strip_formatted_sic(text: str) -> str:
+    r"""Removes whitespace-preceded [sic] notes, as validate_format expects.
+
+    Same result as re.sub(r"\s+\[sic\](?: \([^)]+\))?", "", text), but the
+    scan is driven by the literal "[sic]" instead of trying the pattern at
+    every whitespace run in the transcript.
+    """
+    pieces: List[str] = []
+    pos = 0
+    search = _FORMATTED_SIC_NOTE_RE.search
+    m = search(text)
+    while m is not None:
+        start = m.start()
+        before = text[pos:start]
+        kept = before.rstrip()
+        if len(kept) == len(before):
+            # No whitespace in front, so the note stays; rescan past "[sic".
+            pieces.append(text[pos : start + 4])
+            pos = start + 4
+        else:
+            pieces.append(kept)
+            pos = m.end()
+        m = search(text, pos)
+    if not pieces:
+        return text
+    pieces.append(text[pos:])
+    return "".join(pieces)
+
 
 def strip_sic_annotations(text: str) -> tuple[str, int]:
     """Removes [sic] annotations and returns the cleaned text and count."""
-    pattern = r"\s*\[sic\](?:\s*\([^)]*\))?\s*"
-    cleaned_text, count = re.subn(pattern, " ", text)
+    cleaned_text, count = _SIC_ANNOTATION_RE.subn(" ", text)
     return cleaned_text, count
 
 
@@ -257,15 +327,25 @@ def add_yaml(transcript_filename: str, source_ext: str = "mp4", logger=None) ->
         return False
 
 
+# Markdown symbols dropped from every token before edge stripping.
+_MARKDOWN_SYMBOLS = str.maketrans("", "", "#*_`")
+# Leading/trailing runs of anything that is not a letter or digit.
+_EDGE_NONWORD_RE = re.compile(r"^[\W_]+|[\W_]+$")
+
+
 def _normalize_word_for_validation(w: str) -> str:
     """Strips punctuation and lowercases for validation comparison."""
-    # Explicitly remove markdown symbols before regex
-    w = w.replace("#", "").replace("*", "").replace("_", "").replace("`", "")
-    # Aggressively strip markdown markers and punctuation from start/end
-    w = re.sub(r"^[\W_]+", "", w)
-    w = re.sub(r"[\W_]+$", "", w)
-    w = re.sub(r"[^\w']+$", "", w)
-    return w.lower()
+    # Most tokens are plain words, which have nothing to strip.
+    if w.isalnum():
+        return w.lower()
+    # Explicitly remove markdown symbols before regex; translate is only
+    # paid for the few tokens that contain one.
+    if "*" in w or "_" in w or "#" in w or "`" in w:
+        w = w.translate(_MARKDOWN_SYMBOLS)
+        if w.isalnum():
+            return w.lower()
+    # Aggressively strip markdown markers and punctuation from start/end.
+    return _EDGE_NONWORD_RE.sub("", w).lower()
 
 
 def _compare_transcripts(
@@ -277,27 +357,33 @@ def _compare_transcripts(
     max_mismatches: Optional[int],
 ) -> Dict[str, Any]:
     """Compares raw to formatted transcript, word by word."""
+    normalize = _normalize_word_for_validation
     a_words: List[str] = raw_text.split()
 
     # Filter B words to only those that have content after normalization
     b_words_raw: List[str] = formatted_text.split()
     b_words: List[str] = []
     b_norm: List[str] = []
-    for w in b_words_raw:
-        norm = _normalize_word_for_validation(w)
+    for w, norm in zip(b_words_raw, map(normalize, b_words_raw)):
         if norm:
             b_words.append(w)
             b_norm.append(norm)
 
-    a_norm: List[str] = [_normalize_word_for_validation(w) for w in a_words]
+    a_norm: List[str] = list(map(normalize, a_words))
+    a_len = len(a_norm)
+    b_len = len(b_norm)
 
     mismatches: List[Dict[str, Any]] = []
     checked = 0
     i = 0
     j = 0
     stopped_reason: Optional[str] = None
+    warmup = a_len * 0.2
+    warmed_up = False
+    # -1 forces the checks on the first checked word (max_mismatches=0)
+    evaluated_count = -1
 
-    while i < len(a_words):
+    while i < a_len:
         a_n = a_norm[i]
 
         if not a_n or a_n in skip_words:
@@ -306,7 +392,7 @@ def _compare_transcripts(
 
         checked += 1
 
-        if j >= len(b_words):
+        if j >= b_len:
             mismatches.append(
                 {
                     "a_index": i,
@@ -332,18 +418,19 @@ def _compare_transcripts(
                     j += 1
                     continue
 
-            # Bidirectional Lookahead Strategy
-            b_match_offset = None
-            for offset in range(1, max_lookahead + 1):
-                if j + offset < len(b_words) and a_n == b_norm[j + offset]:
-                    b_match_offset = offset
-                    break
+            # Bidirectional Lookahead Strategy: nearest occurrence within the
+            # window, found by list.index in C (stop may run past the end)
+            try:
+                b_match_offset = b_norm.index(a_n, j + 1, j + 1 + max_lookahead) - j
+            except ValueError:
+                b_match_offset = None
 
-            a_match_offset = None
-            for offset in range(1, max_lookahead + 1):
-                if i + offset < len(a_norm) and b_norm[j] == a_norm[i + offset]:
-                    a_match_offset = offset
-                    break
+            try:
+                a_match_offset = (
+                    a_norm.index(b_norm[j], i + 1, i + 1 + max_lookahead) - i
+                )
+            except ValueError:
+                a_match_offset = None
 
             action = "mismatch"
 
@@ -353,12 +440,12 @@ def _compare_transcripts(
                 action = "skip_a"
             elif b_match_offset is not None and a_match_offset is not None:
                 path1_score = 0
-                if i + 1 < len(a_norm) and j + b_match_offset + 1 < len(b_words):
+                if i + 1 < a_len and j + b_match_offset + 1 < b_len:
                     if a_norm[i + 1] == b_norm[j + b_match_offset + 1]:
                         path1_score = 1
 
                 path2_score = 0
-                if i + a_match_offset + 1 < len(a_norm) and j + 1 < len(b_words):
+                if i + a_match_offset + 1 < a_len and j + 1 < b_len:
                     if a_norm[i + a_match_offset + 1] == b_norm[j + 1]:
                         path2_score = 1
 
@@ -398,13 +485,20 @@ def _compare_transcripts(
                 )
                 i += 1
 
-        if checked > 0:
-            mismatch_count = len(mismatches)
+        # Early stopping. Between mismatches the count is fixed and the ratio
+        # only falls, so the checks can only newly pass when a mismatch was
+        # recorded or when checked first clears the warm-up.
+        mismatch_count = len(mismatches)
+        if mismatch_count != evaluated_count or (
+            not warmed_up and checked > warmup
+        ):
+            evaluated_count = mismatch_count
+            warmed_up = checked > warmup
             mismatch_ratio = mismatch_count / checked
             if max_mismatches is not None and mismatch_count >= max_mismatches:
                 stopped_reason = "max_mismatches"
                 break
-            if checked > len(a_words) * 0.2 and mismatch_ratio > max_mismatch_ratio:
+            if warmed_up and mismatch_ratio > max_mismatch_ratio:
                 stopped_reason = "mismatch_ratio"
                 break
 
@@ -412,7 +506,7 @@ def _compare_transcripts(
     mismatch_ratio = mismatch_count / checked if checked > 0 else 0.0
 
     return {
-        "a_word_count": len(a_words),
+        "a_word_count": a_len,
         "b_word_count": len(b_words),
         "checked_words": checked,
         "mismatch_count": mismatch_count,
@@ -450,59 +544,28 @@ def validate_format(
 
         formatted_text = strip_yaml_frontmatter(formatted_text)
 
-        raw_clean = re.sub(
-            r"^\s*(\[[\d:.]+\]\s+[^:]+:|Unknown Speaker|Speaker \d+)\s+\d+:\d+(?::\d+)?",
-            "",
-            raw_text,
-            flags=re.MULTILINE,
-        )
-        raw_clean = re.sub(r"^\s*Transcribed by\b.*", "",
-                           raw_clean, flags=re.MULTILINE)
+        raw_clean = _RAW_STAMP_OR_FOOTER_RE.sub("", raw_text)
 
-        raw_clean = re.sub(
-            r"[\[\(]?\b\d+:\d{2}(?::\d{2})?(?:[ap]m)?[\]\)]?",
-            " ",
-            raw_clean,
-            flags=re.IGNORECASE,
-        )
-        raw_clean = re.sub(r"(?:^|\s)[\[\(]?:\d{2}\b[\]\)]?", " ", raw_clean)
+        raw_clean = _RAW_CLOCK_RE.sub(" ", raw_clean)
+        raw_clean = _RAW_BARE_SECONDS_RE.sub(" ", raw_clean)
 
         # Remove procedural speech from raw text to avoid validation errors
-        # These are commonly removed by the formatting model
-        procedural_patterns = [
-            r"\bnext slide(?:,? please)?\.?",
-            r"\bnext one(?:,? please)?\.?",
-            r"\bslide please\.?",
-            r"\bintro\b",  
-            r"(?:^|[\.\!\?]\s+)so(?:,)?\s+",   # Sentence-starting 'So'
-            r"(?:^|[\.\!\?]\s+)okay(?:,)?\s+", # Sentence-starting 'Okay'
-            r"(?:^|[\.\!\?]\s+)right(?:,)?\s+", # Sentence-starting 'Right'
-            r"\bjust to emphasize(?: this)?",
-            r"\bone please",
-            r"\bthere you see",
-            r"\bthanks\.?",
-            r"\bnext(?:,)?\s+",
-            r"\bone(?:,)?\s+",
-            r"\bslide(?:,)?\s+",
-            r"\bplease\.?"
-        ]
-        for p in procedural_patterns:
-            raw_clean = re.sub(p, " ", raw_clean, flags=re.IGNORECASE | re.MULTILINE)
-
-        formatted_clean, _ = re.subn(
-            r"\s+\[sic\](?: \([^)]+\))?", "", formatted_text)
-        formatted_clean = re.sub(r"\*\*[^*]+:\*\*\s*", "", formatted_clean)
-
-        formatted_clean = re.sub(
-            r"^\s*#+.*$", "", formatted_clean, flags=re.MULTILINE)
+        for pattern in _RAW_PROCEDURAL_RES:
+            raw_clean = pattern.sub(" ", raw_clean)
+
+        formatted_clean = _strip_formatted_sic(formatted_text)
+        formatted_clean = _FORMATTED_SPEAKER_RE.sub("", formatted_clean)
+
+        formatted_clean = _FORMATTED_HEADING_RE.sub("", formatted_clean)
 
         skip_words = set()
         if skip_words_file:
-            skip_words = {
-                normalize_text(word)
-                for word in Path(skip_words_file).read_text().splitlines()
-                if word and not word.startswith("#")
-            }
+            # One word per line; iterate the file rather than reading it whole
+            with open(skip_words_file, encoding="utf-8") as f:
+                for line in f:
+                    word = line.rstrip("\n")
+                    if word and not word.startswith("#"):
+                        skip_words.add(normalize_text(word))
 
         result = _compare_transcripts(
             raw_clean,
@@ -101,3 +101,15 @@ def test_format_bowen_refs_keeps_full_quote_text():
 
     assert "Cancer is a part of nature and not a disease." in rendered
     assert "..." not in rendered
+
+
+def test_validator_keeps_its_own_attribution_rule():
+    from transcript_validate_bowen import contains_attribution
+
+    assert contains_attribution("Bowen explained that anxiety is contagious.")
+    assert contains_attribution(
+        "Bowen, as many of you know from years of study in this field and from "
+        "reading the clinical papers. Later he defined differentiation."
+    )
+    assert contains_attribution("Bowen theory, as Dr. Kerr said, is about the unit.")
+    assert not contains_attribution("Anxiety drives the system.")
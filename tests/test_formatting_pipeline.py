@@ -1,9 +1,17 @@
+import logging
+import re
+import tempfile
 import unittest
+from pathlib import Path
+from unittest.mock import patch
 
+import config
 from formatting_pipeline import (
     _generate_yaml_front_matter,
     _normalize_word_for_validation,
+    _strip_formatted_sic,
     strip_sic_annotations,
+    validate_format,
 )
 
 
@@ -40,6 +48,22 @@ class TestFormattingPipeline(unittest.TestCase):
         self.assertEqual(cleaned.strip(), "Another errror here.")
         self.assertEqual(count, 1)
 
+    def test_strip_formatted_sic_matches_whitespace_anchored_pattern(self):
+        pattern = re.compile(r"\s+\[sic\](?: \([^)]+\))?")
+        cases = [
+            "no notes here",
+            "teh [sic] (the) cat",
+            "line one\n[sic] starts line two",
+            "glued[sic] stays, spaced [sic] goes",
+            "x[sic] (a [sic]) y",
+            "double [sic] [sic] note",
+            "[sic] at the very start",
+            "trailing [sic]",
+        ]
+        for text in cases:
+            with self.subTest(text=text):
+                self.assertEqual(_strip_formatted_sic(text), pattern.sub("", text))
+
     def test_normalize_word_for_validation(self):
         # Basic lowercasing
         self.assertEqual(_normalize_word_for_validation("Word"), "word")
@@ -54,6 +78,64 @@ class TestFormattingPipeline(unittest.TestCase):
         self.assertEqual(_normalize_word_for_validation("*word*"), "word")
         self.assertEqual(_normalize_word_for_validation("__word__"), "word")
         self.assertEqual(_normalize_word_for_validation("`code`"), "code")
+        self.assertEqual(_normalize_word_for_validation("multi_word#tag"), "multiwordtag")
+        self.assertEqual(_normalize_word_for_validation("**Speaker:**"), "speaker")
+        self.assertEqual(_normalize_word_for_validation("**"), "")
+
+        # Inner punctuation is kept; edge-only tokens vanish
+        self.assertEqual(_normalize_word_for_validation("(don't)"), "don't")
+        self.assertEqual(_normalize_word_for_validation("self-aware,"), "self-aware")
+        self.assertEqual(_normalize_word_for_validation("—"), "")
+        self.assertEqual(_normalize_word_for_validation("Émile."), "émile")
+
+    def test_validate_format_cleans_raw_and_formatted_text(self):
+        raw = (
+            "Speaker 1 0:05\n"
+            "So, the family is an emotional unit. Next slide, please.\n"
+            "[00:01] Differentiation matters 1:23pm a lot.\n"
+            "Transcribed by https://otter.ai\n"
+        )
+        formatted = (
+            "---\ntitle: x\n---\n"
+            "## Section 1\n\n"
+            "**Speaker 1:** The family is an emotional unit.\n"
+            "Differentiation matters [sic] (matter) a lot.\n"
+        )
+        logs = self._run_validate_format(raw, formatted)
+
+        self.assertIn("INFO:test_validate_format:mismatch_count: 0", logs.output)
+
+    def test_validate_format_reads_skip_words_file(self):
+        raw = "Um, the family is, uh, an emotional unit.\n"
+        formatted = "The family is an emotional unit.\n"
+
+        logs = self._run_validate_format(raw, formatted, skip_words="# fillers\num\nuh\n")
+
+        self.assertIn("INFO:test_validate_format:mismatch_count: 0", logs.output)
+        self.assertIn("INFO:test_validate_format:checked_words: 6", logs.output)
+
+    def _run_validate_format(self, raw, formatted, skip_words=None):
+        with tempfile.TemporaryDirectory() as tmp:
+            source_dir = Path(tmp) / "source"
+            projects_dir = Path(tmp) / "projects"
+            (projects_dir / "Talk").mkdir(parents=True)
+            source_dir.mkdir()
+            (source_dir / "Talk.txt").write_text(raw, encoding="utf-8")
+            (projects_dir / "Talk" / f"Talk{config.SUFFIX_FORMATTED}").write_text(
+                formatted, encoding="utf-8"
+            )
+            skip_words_file = None
+            if skip_words is not None:
+                skip_words_file = Path(tmp) / "skip_words.txt"
+                skip_words_file.write_text(skip_words, encoding="utf-8")
+            with patch.object(config, "SOURCE_DIR", source_dir), \
+                    patch.object(config, "PROJECTS_DIR", projects_dir):
+                logger = logging.getLogger("test_validate_format")
+                with self.assertLogs(logger, level="INFO") as logs:
+                    self.assertTrue(validate_format(
+                        "Talk.txt", skip_words_file=skip_words_file, logger=logger
+                    ))
+        return logs
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,3 +1,4 @@
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock
@@ -83,3 +84,162 @@ def test_cap_max_tokens_defaults_to_32000_when_model_limit_unknown():
         logger=None,
     )
     assert capped == 32000
+
+
+def test_check_problematic_terms_reports_overlapping_terms_in_list_order():
+    validator = _build_validator()
+    validator.problematic_terms = ["system", "emotional system", "systems thinking", "fusion"]
+
+    found = validator.check_problematic_terms("Emotional Systems Thinking")
+
+    assert found == ["system", "emotional system", "systems thinking"]
+
+
+def test_run_sends_first_batch_alone_then_reports_in_batch_order(monkeypatch):
+    validator = _build_validator()
+    sections = [
+        {"number": n, "heading": f"H{n}", "content": "x", "original_heading": f"H{n}"}
+        for n in range(1, 4 * transcript_validate_headers.BATCH_SIZE + 1)
+    ]
+    first_done = threading.Event()
+    calls = []
+
+    def fake_validate(batch, model):
+        first = batch[0]["number"]
+        calls.append((first, first_done.is_set()))
+        if first == 1:
+            first_done.set()
+        if first == 1 + 2 * transcript_validate_headers.BATCH_SIZE:
+            raise ValueError("bad request")
+        return f"ok {first}"
+
+    monkeypatch.setattr(validator, "parse_transcript", lambda _path: sections)
+    monkeypatch.setattr(validator, "validate_batch", fake_validate)
+    save_mock = MagicMock()
+    monkeypatch.setattr(validator, "_save_report", save_mock)
+
+    result = validator.run(Path("dummy.md"), model="claude-3-5-haiku-20241022")
+
+    assert result is False
+    assert calls[0] == (1, False)
+    assert all(done for _first, done in calls[1:])
+    _path, results, failed = save_mock.call_args.args
+    assert [r["batch"] for r in results] == [1, 2, 4]
+    assert failed == [3]
+
+
+def test_validate_batch_sends_sections_as_delimited_blocks(monkeypatch):
+    validator = _build_validator()
+    captured = {}
+
+    def fake_call(*args, **kwargs):
+        captured["content"] = kwargs["messages"][0]["content"]
+        return _fake_message()
+
+    monkeypatch.setattr(transcript_validate_headers, "call_claude_with_retry", fake_call)
+
+    batch = [
+        {"number": 1, "heading": "H1", "content": "Body one"},
+        {"number": 2, "heading": "H2", "content": "Body two"},
+    ]
+    validator.validate_batch(batch, model="claude-sonnet-4-20250514")
+
+    rule = "-" * 40
+    assert captured["content"] == (
+        f"\nSECTION 1:\nHeading: H1\nContent: Body one\n{rule}\n"
+        f"\nSECTION 2:\nHeading: H2\nContent: Body two\n{rule}\n"
+    )
+
+
+def test_parse_transcript_splits_on_h2_and_cleans_headings(tmp_path):
+    validator = _build_validator()
+    transcript = tmp_path / "talk - formatted.md"
+    transcript.write_text(
+        "# Title\n\nPreamble text.\n\n"
+        "## **Opening Remarks**\n\nFirst body.\n\n"
+        "### Sub heading\nStill first.\n"
+        "## __Second__ Part  \nSecond body.\n",
+        encoding="utf-8",
+    )
+
+    sections = validator.parse_transcript(transcript)
+
+    assert sections == [
+        {
+            "number": 1,
+            "heading": "Opening Remarks",
+            "content": "First body.\n\n### Sub heading\nStill first.",
+            "original_heading": "**Opening Remarks**",
+        },
+        {
+            "number": 2,
+            "heading": "Second Part",
+            "content": "Second body.",
+            "original_heading": "__Second__ Part",
+        },
+    ]
+
+
+def test_check_problematic_terms_ignores_heading_case():
+    validator = _build_validator()
+    validator.problematic_terms = ["anxiety", "fusion", "bowen theory"]
+
+    assert validator.check_problematic_terms("ANXIETY and Fusion") == ["anxiety", "fusion"]
+    assert validator.check_problematic_terms("Q&A") == []
+
+
+def test_save_report_writes_flags_responses_and_failures(tmp_path, monkeypatch):
+    validator = _build_validator()
+    monkeypatch.setattr(config, "PROJECTS_DIR", tmp_path / "projects")
+    input_path = tmp_path / "Talk - formatted.md"
+    input_path.write_text("## A\nx\n", encoding="utf-8")
+    results = [
+        {
+            "batch": 1,
+            "sections": [
+                {"number": 1, "heading": "Anxiety", "local_flag": ["anxiety"]},
+                {"number": 2, "heading": "Plain"},
+            ],
+            "response": "All good.",
+        }
+    ]
+
+    validator._save_report(input_path, results, [2])
+
+    report = (
+        tmp_path / "projects" / "Talk" / f"Talk{config.SUFFIX_HEADER_VAL_REPORT}"
+    ).read_text(encoding="utf-8")
+    assert report.startswith("# Header Validation Report\nSource: Talk - formatted.md\n")
+    assert "- **Section 1**: 'Anxiety' contains ['anxiety']\n" in report
+    assert "None found." not in report
+    assert "\n### Batch 1\nAll good.\n" + "=" * 50 + "\n" in report
+    assert report.endswith(
+        "\n## Failed Batches\n"
+        "The following batches failed API validation and were not evaluated: 2\n"
+    )
+
+
+def test_loaders_reuse_parsed_files_until_they_change(tmp_path):
+    validator = _build_validator()
+    validator.terms_file = tmp_path / "terms.md"
+    validator.prompt_file = tmp_path / "prompt.md"
+    validator.terms_file.write_text("# comment\nAnxiety\n\nFusion\n", encoding="utf-8")
+    validator.prompt_file.write_text("Check {batch_content}", encoding="utf-8")
+
+    assert validator._load_problematic_terms() == ["anxiety", "fusion"]
+    assert validator._load_prompt() == "Check {batch_content}"
+    hits = transcript_validate_headers._read_problematic_terms.cache_info().hits
+    assert validator._load_problematic_terms() == ["anxiety", "fusion"]
+    assert transcript_validate_headers._read_problematic_terms.cache_info().hits == hits + 1
+
+    validator.terms_file.write_text("Cutoff\n", encoding="utf-8")
+    validator.prompt_file.write_text("New {batch_content} prompt", encoding="utf-8")
+    assert validator._load_problematic_terms() == ["cutoff"]
+    assert validator._load_prompt() == "New {batch_content} prompt"
+
+
+def test_h2_heading_pattern_only_matches_at_line_start():
+    pattern = transcript_validate_headers._H2_HEADING_RE
+    text = "## First\nintro ## not a heading\n### Sub\n##\tTabbed\n## Last"
+
+    assert [m.group(1) for m in pattern.finditer(text)] == ["First", "Tabbed", "Last"]
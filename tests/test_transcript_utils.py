@@ -1,7 +1,17 @@
+import random
+import re
 import unittest
 
+from rapidfuzz.distance import Indel
+
+import config
 from transcript_utils import (
+    _section_start_pattern,
     extract_section,
+    find_best_match_in_html,
+    find_best_matches_in_html,
+    find_text_in_content,
+    find_text_in_normalized,
     markdown_to_html,
     normalize_text,
     parse_filename_metadata,
@@ -9,6 +19,23 @@ from transcript_utils import (
 )
 
 
+def _full_word_window_scan(needle_norm, haystack_norm):
+    """Reference for find_text_in_normalized: score every word window."""
+    if needle_norm in haystack_norm:
+        return 1.0
+    needle_len = len(needle_norm.split())
+    spans = [m.span() for m in re.finditer(r"\S+", haystack_norm)]
+    best = 0
+    for i in range(len(spans) - needle_len + 1):
+        ratio = Indel.normalized_similarity(
+            needle_norm, haystack_norm[spans[i][0]:spans[i + needle_len - 1][1]])
+        if ratio > best and ratio >= config.FUZZY_MATCH_THRESHOLD:
+            best = ratio
+            if ratio >= config.FUZZY_MATCH_EARLY_STOP:
+                break
+    return best
+
+
 class TestTranscriptUtils(unittest.TestCase):
 
     def test_markdown_to_html_headings(self):
@@ -48,6 +75,12 @@ class TestTranscriptUtils(unittest.TestCase):
             "this has punctuation"
         )
 
+    def test_normalize_text_unicode_html(self):
+        self.assertEqual(
+            normalize_text("<p>Café &amp; NAÏVE &eacute;lan</p>", aggressive=True),
+            "café & naïve élan",
+        )
+
     def test_strip_yaml_frontmatter(self):
         content = """---
 title: My Title
@@ -92,6 +125,12 @@ Some other content.
         non_existent_section = extract_section(sample_markdown_content, "Non Existent")
         self.assertEqual(non_existent_section, "")
 
+    def test_extract_section_reuses_compiled_start_pattern(self):
+        extract_section("## Key Terms\n\n- a", "Key Terms")
+        pattern = _section_start_pattern("Key Terms")
+        self.assertIs(pattern, _section_start_pattern("Key Terms"))
+        self.assertTrue(pattern.search("### **2. Key   Terms**"))
+
     def test_parse_filename_metadata(self):
         metadata = parse_filename_metadata("My Awesome Title - John Doe - 2025-12-21.txt")
         self.assertEqual(metadata["title"], "My Awesome Title")
@@ -123,5 +162,211 @@ Some other content.
         with self.assertRaises(ValueError):
             parse_filename_metadata("invalid-filename.txt")
 
+    def test_find_text_in_content_fuzzy_window(self):
+        haystack = (
+            "Opening remarks go here. The family system responds to anxiety "
+            "in predictable ways over many generations. Closing remarks."
+        )
+        start, end, ratio = find_text_in_content(
+            "the family system reacts to anxiety in predictable ways",
+            haystack,
+            aggressive_normalization=True,
+        )
+        self.assertGreaterEqual(ratio, 0.85)
+        self.assertLess(ratio, 1.0)
+        self.assertIsNotNone(start)
+        self.assertGreater(end, start)
+
+    def test_find_text_in_content_prefix_hit_scores_window(self):
+        haystack = (
+            "Intro. Anxiety in the family moves through the relationship "
+            "system in a very reliable pattern. Outro."
+        )
+        start, end, ratio = find_text_in_content(
+            "anxiety in the family moves through the relationship system in a reliable pattern",
+            haystack,
+            aggressive_normalization=True,
+        )
+        self.assertGreaterEqual(ratio, 0.85)
+        self.assertLess(ratio, 1.0)
+        self.assertEqual(start, len("intro "))
+        self.assertGreater(end, start)
+
+    def test_find_text_in_normalized_prefix_hit_keeps_best_word_window(self):
+        haystack_norm = normalize_text(
+            "Anxiety in the family moves through the relationship system in a "
+            "strange way today. Later on. Anxeity in the family moves through the "
+            "relationship system in a reliable pattern.",
+            aggressive=True,
+        )
+        needle_norm = normalize_text(
+            "anxiety in the family moves through the relationship system in a reliable pattern",
+            aggressive=True,
+        )
+        start, end, ratio = find_text_in_normalized(needle_norm, haystack_norm)
+        self.assertGreaterEqual(ratio, 0.95)
+        self.assertEqual(
+            haystack_norm[start:end],
+            "anxeity in the family moves through the relationship system in a reliable pattern",
+        )
+
+    def test_find_text_in_normalized_positions_are_normalized(self):
+        haystack_norm = normalize_text("Hello, World! The family system.", aggressive=True)
+        needle_norm = normalize_text("The family", aggressive=True)
+        start, end, ratio = find_text_in_normalized(needle_norm, haystack_norm)
+        self.assertEqual(ratio, 1.0)
+        self.assertEqual(haystack_norm[start:end], "the family")
+
+    def test_find_text_in_normalized_long_needle_in_long_text(self):
+        quote = ("the family system reacts to chronic anxiety by pulling members "
+                 "closer together until individuality gives way")
+        haystack_norm = normalize_text(
+            "filler words here. " * 300 + quote.replace("reacts", "responds")
+            + ". more filler text." * 300,
+            aggressive=True,
+        )
+        start, end, ratio = find_text_in_normalized(
+            normalize_text(quote, aggressive=True), haystack_norm)
+        self.assertGreaterEqual(ratio, 0.85)
+        self.assertTrue(haystack_norm[start:end].startswith("the family system responds"))
+
+    def test_find_text_in_normalized_keeps_windows_longer_than_needle(self):
+        # Every word grew a suffix: the window scores 0.86 on Indel while the
+        # best needle-length character window scores only 0.74.
+        needle_norm = "family self a in the of family self"
+        haystack_norm = ("some filler words before familys self asly insly thes "
+                         "ofs familys selfs and some after")
+        start, end, ratio = find_text_in_normalized(needle_norm, haystack_norm)
+        self.assertAlmostEqual(ratio, 0.8642, places=4)
+        self.assertEqual(haystack_norm[start:end],
+                         "familys self asly insly thes ofs familys selfs")
+
+    def test_find_text_in_normalized_matches_full_word_window_scan(self):
+        # Short random words with suffixed needles make windows longer than
+        # the needle, the case a needle-length prefilter can miss.
+        rng = random.Random(1)
+        vocab = ["".join(rng.choice("aeiost") for _ in range(rng.randint(1, 4)))
+                 for _ in range(40)]
+        words = [rng.choice(vocab) for _ in range(1000)]
+        haystack_norm = " ".join(words)
+        for _ in range(150):
+            i = rng.randrange(len(words) - 12)
+            needle = words[i:i + rng.randint(3, 10)]
+            for _ in range(rng.randint(1, len(needle))):
+                needle[rng.randrange(len(needle))] += rng.choice(["s", "ly", "ed"])
+            needle_norm = " ".join(needle)
+            expected = _full_word_window_scan(needle_norm, haystack_norm)
+            ratio = find_text_in_normalized(needle_norm, haystack_norm)[2]
+            if expected >= config.FUZZY_MATCH_EARLY_STOP:
+                self.assertGreaterEqual(ratio, config.FUZZY_MATCH_EARLY_STOP, needle_norm)
+            else:
+                self.assertAlmostEqual(ratio, expected, msg=needle_norm)
+
+    def test_find_text_in_content_no_match(self):
+        self.assertEqual(
+            find_text_in_content("completely unrelated words", "short text here"),
+            (None, None, 0),
+        )
+
+    def test_find_best_match_in_html_exact_returns_needle(self):
+        haystack = normalize_text("<p>Differentiation of self is <b>key</b>.</p>", aggressive=True)
+        self.assertEqual(
+            find_best_match_in_html("differentiation of self", haystack),
+            (1.0, "differentiation of self"),
+        )
+
+    def test_find_best_match_in_html_fuzzy_window(self):
+        haystack = normalize_text(
+            "<p>intro words. the emotional system governs behaviour in families. outro</p>",
+            aggressive=True,
+        )
+        ratio, match = find_best_match_in_html(
+            "the emotional system governs behavior in families", haystack)
+        self.assertGreaterEqual(ratio, 0.85)
+        self.assertEqual(match, "the emotional system governs behaviour in families")
+
+    def test_find_best_match_in_html_needle_longer_than_haystack(self):
+        self.assertEqual(
+            find_best_match_in_html("one two three four", "one two"),
+            (0.0, None),
+        )
+
+    def test_find_best_matches_in_html_mixed_lengths(self):
+        haystack = normalize_text(
+            "<p>anxiety spreads through the family. the triangle stabilizes two people. "
+            "a calm leader lowers reactivity in the group.</p>",
+            aggressive=True,
+        )
+        results = find_best_matches_in_html(
+            [
+                "the triangle stabilises two people",
+                "anxiety spreads through the family",
+                "qqq",
+                " ".join("abcdefghijklmnopqrstuvw"),
+            ],
+            haystack,
+        )
+        self.assertEqual(results[0][1], "the triangle stabilizes two people")
+        self.assertGreaterEqual(results[0][0], 0.85)
+        self.assertEqual(results[1], (1.0, "anxiety spreads through the family"))
+        self.assertEqual(results[2], (0, None))
+        self.assertEqual(results[3], (0.0, None))
+
+    def test_find_best_match_in_html_first_and_last_words_differ(self):
+        # Every window is scored; a mistranscribed first/last word must not
+        # hide the right one.
+        haystack = normalize_text(
+            "<p>filler text. well the nuclear family emotional system carries "
+            "the anxiety forward. more filler.</p>",
+            aggressive=True,
+        )
+        ratio, match = find_best_match_in_html(
+            "will the nuclear family emotional system carries the anxiety forwards",
+            haystack,
+        )
+        self.assertGreaterEqual(ratio, 0.85)
+        self.assertEqual(
+            match, "well the nuclear family emotional system carries the anxiety forward")
+
+    def test_find_best_match_in_html_short_quote_clustered_typo(self):
+        # Short needles share the LCS scorer: 2 * 26 common chars / (28 + 27).
+        haystack = normalize_text(
+            "<p>intro. the togethrenss force pulls. outro</p>", aggressive=True)
+        ratio, match = find_best_match_in_html("the togetherness force pulls", haystack)
+        self.assertAlmostEqual(ratio, 52 / 55)
+        self.assertEqual(match, "the togethrenss force pulls")
+
+    def test_find_best_match_in_html_scores_word_windows(self):
+        # Word-aligned windows score this edited quote 0.855; a character
+        # partial_ratio alignment would put it at 0.843, below the 0.85 bar.
+        haystack = normalize_text(
+            "<p>something is disturbing the homeostasis within the particular tissue "
+            "involved which I think is also a reflection of the disturbance of "
+            "homeostasis for the organism as a whole</p>",
+            aggressive=True,
+        )
+        ratio, match = find_best_match_in_html(
+            "the particular tissue involved, zebra I quantum is also a reflection of",
+            haystack,
+        )
+        self.assertGreaterEqual(ratio, 0.85)
+        self.assertEqual(
+            match, "the particular tissue involved which i think is also a reflection of")
+
+    def test_find_best_match_in_html_partial_exact_is_scored_fuzzily(self):
+        # Two of three chunks appear verbatim; that must not count as exact.
+        haystack = normalize_text(
+            "<p>people who are more differentiated can hold a position "
+            "without needing agreement from others around them</p>",
+            aggressive=True,
+        )
+        ratio, match = find_best_match_in_html(
+            "people who are more differentiated can state a view "
+            "without needing agreement from others around them",
+            haystack,
+        )
+        self.assertLess(ratio, 1.0)
+        self.assertTrue(match.startswith("people who are more differentiated can hold"))
+
 if __name__ == '__main__':
     unittest.main()
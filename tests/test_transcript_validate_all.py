@@ -0,0 +1,68 @@
+import sys
+from unittest.mock import patch
+
+import config
+import transcript_validate_all
+
+
+def test_main_validates_every_base_name_and_reports_failure(tmp_path, monkeypatch):
+    for base_name in ("A - X - 2025-01-01", "B - X - 2025-01-01"):
+        project_dir = tmp_path / base_name
+        project_dir.mkdir()
+        (project_dir / f"{base_name}{config.SUFFIX_FORMATTED}").write_text(
+            "## Section 1\ntext\n", encoding="utf-8")
+
+    calls = []
+    monkeypatch.setattr(transcript_validate_all, "validate_topics_lightweight",
+                        lambda path, base, logger, *shared: calls.append(("topics", base)) or True)
+    monkeypatch.setattr(transcript_validate_all, "validate_key_terms_fidelity",
+                        lambda path, base, logger, *shared: calls.append(("key_terms", base)) or True)
+    monkeypatch.setattr(transcript_validate_all, "validate_html_highlights",
+                        lambda base, logger: calls.append(("html", base)) or base.startswith("A"))
+    monkeypatch.setattr(transcript_validate_all, "setup_logging", lambda name: None)
+    monkeypatch.setattr(sys, "argv", [
+        "transcript_validate_all.py", "A - X - 2025-01-01", "B - X - 2025-01-01",
+        "Missing - X - 2025-01-01",
+    ])
+
+    with patch.object(config, "PROJECTS_DIR", tmp_path):
+        assert transcript_validate_all.main() == 1
+
+    assert calls == [
+        ("topics", "A - X - 2025-01-01"),
+        ("key_terms", "A - X - 2025-01-01"),
+        ("html", "A - X - 2025-01-01"),
+        ("topics", "B - X - 2025-01-01"),
+        ("key_terms", "B - X - 2025-01-01"),
+        ("html", "B - X - 2025-01-01"),
+    ]
+
+
+def test_validate_all_reads_and_normalizes_transcript_once(tmp_path, monkeypatch):
+    base_name = "A - X - 2025-01-01"
+    project_dir = tmp_path / base_name
+    project_dir.mkdir()
+    (project_dir / f"{base_name}{config.SUFFIX_FORMATTED}").write_text(
+        "---\ntitle: A\n---\n## Section 1\nThe Family, System.\n", encoding="utf-8")
+
+    shared = {}
+    monkeypatch.setattr(transcript_validate_all, "validate_topics_lightweight",
+                        lambda path, base, logger, *ctx: shared.setdefault("topics", ctx) and True)
+    monkeypatch.setattr(transcript_validate_all, "validate_key_terms_fidelity",
+                        lambda path, base, logger, *ctx: shared.setdefault("key_terms", ctx) and True)
+    monkeypatch.setattr(transcript_validate_all, "validate_html_highlights",
+                        lambda base, logger: True)
+    normalize_calls = []
+    real_normalize = transcript_validate_all.normalize_text
+    monkeypatch.setattr(transcript_validate_all, "normalize_text",
+                        lambda text, **kw: normalize_calls.append(text) or real_normalize(text, **kw))
+
+    with patch.object(config, "PROJECTS_DIR", tmp_path):
+        assert transcript_validate_all.validate_all(base_name, None) is True
+
+    assert len(normalize_calls) == 1
+    transcript, transcript_norm = shared["topics"]
+    assert shared["key_terms"][0] is transcript
+    assert shared["key_terms"][1] is transcript_norm
+    assert not transcript.startswith("---")
+    assert "the family system" in transcript_norm
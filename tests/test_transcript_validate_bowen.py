@@ -0,0 +1,56 @@
+import config
+from transcript_validate_bowen import validate_bowen_items
+
+
+def _write_project(tmp_path, monkeypatch, quotes_md: str, transcript: str):
+    base_name = "Bowen-Validate-Test"
+    projects_dir = tmp_path / "projects"
+    project_dir = projects_dir / base_name
+    project_dir.mkdir(parents=True, exist_ok=True)
+
+    formatted_path = project_dir / f"{base_name}{config.SUFFIX_FORMATTED}"
+    formatted_path.write_text(transcript, encoding="utf-8")
+    (project_dir / f"{base_name}{config.SUFFIX_BOWEN}").write_text(
+        quotes_md, encoding="utf-8"
+    )
+
+    monkeypatch.setattr(config, "PROJECTS_DIR", projects_dir)
+    return base_name, formatted_path
+
+
+def test_validate_bowen_items_reports_match_and_missing_attribution(
+    tmp_path, monkeypatch, capsys
+):
+    transcript = (
+        "## Section 1\n\n"
+        "**Speaker 1:** Murray Bowen said anxiety binds the family process "
+        "over time. Differentiation helps with reactivity in every system.\n"
+    )
+    quotes_md = (
+        "## Bowen References\n\n"
+        '- **Anxiety:** "Murray Bowen said anxiety binds the family process over time."\n'
+        '- **Reactivity:** "Differentiation helps with reactivity in every system."\n'
+    )
+    base_name, formatted_path = _write_project(
+        tmp_path, monkeypatch, quotes_md, transcript
+    )
+
+    validate_bowen_items(base_name, formatted_path)
+    out = capsys.readouterr().out
+
+    assert "1. Anxiety" in out
+    assert "✅ EXACT MATCH" in out
+    assert "2. Reactivity" in out
+    assert "MISSING ATTRIBUTION" in out
+    assert "✅ Exact matches: 1" in out
+    assert "❌ Missing attribution: 1" in out
+
+
+def test_validate_bowen_items_without_references(tmp_path, monkeypatch, capsys):
+    base_name, formatted_path = _write_project(
+        tmp_path, monkeypatch, "## Bowen References\n\nNone.\n", "## Section 1\nText.\n"
+    )
+
+    validate_bowen_items(base_name, formatted_path)
+
+    assert "No Bowen references found" in capsys.readouterr().out
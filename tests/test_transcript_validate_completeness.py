@@ -0,0 +1,140 @@
+import config
+from transcript_validate_completeness import (
+    _compile_markers,
+    _count_words,
+    _project_entries,
+    _scan_file,
+    main,
+    validate_all,
+    validate_blog,
+    validate_formatted_file,
+)
+
+
+def _project_dir(tmp_path, monkeypatch, base_name):
+    project_dir = tmp_path / "projects" / base_name
+    project_dir.mkdir(parents=True)
+    monkeypatch.setattr(config, "PROJECTS_DIR", tmp_path / "projects")
+    return project_dir
+
+
+def test_scan_file_collects_structure_in_one_pass(tmp_path):
+    path = tmp_path / "doc.md"
+    path.write_text(
+        "---\ntitle: x\n---\n# Title\n\n## Section\n\nSome words here [Content Cut Off]\n",
+        encoding="utf-8",
+    )
+
+    scan = _scan_file(path)
+
+    assert scan["has_front_matter"] is True
+    assert scan["has_h1"] is True
+    assert scan["has_h2"] is True
+    assert scan["word_count"] == 14
+    assert scan["truncation_markers"] == ["[content cut off]"]
+    assert scan["tail"].endswith("[Content Cut Off]\n")
+
+
+def test_scan_file_reports_each_truncation_marker_once_in_canonical_order(tmp_path):
+    path = tmp_path / "doc.md"
+    path.write_text(
+        "a [output limit reached] b\nc ...[TRUNCATED] d ...[truncated]\n",
+        encoding="utf-8",
+    )
+
+    assert _scan_file(path)["truncation_markers"] == [
+        "...[truncated]",
+        "[OUTPUT LIMIT REACHED]",
+    ]
+
+
+def test_compile_markers_prefers_longest_overlapping_marker():
+    pattern, by_lower = _compile_markers(["[cut]", "[cut] here"])
+
+    match = pattern.search(b"text [CUT] HERE")
+
+    assert by_lower[match.group(0).lower()] == "[cut] here"
+
+
+def test_scan_file_tail_is_last_100_characters_of_multibyte_text(tmp_path):
+    path = tmp_path / "doc.md"
+    path.write_text("intro\n" + "é" * 150 + " end.", encoding="utf-8")
+
+    scan = _scan_file(path)
+
+    assert scan["tail"] == "é" * 95 + " end."
+    assert scan["word_count"] == 3
+
+
+def test_count_words_matches_str_split():
+    text = "  one two\tthree\u00a0four\n\nfive  "
+    assert _count_words(text) == len(text.split()) == 5
+    assert _count_words("") == 0
+
+
+def test_validate_formatted_file_reports_truncation_and_missing_front_matter(
+    tmp_path, monkeypatch
+):
+    base_name = "Completeness-Test"
+    project_dir = _project_dir(tmp_path, monkeypatch, base_name)
+    (project_dir / f"{base_name}{config.SUFFIX_YAML}").write_text(
+        "## Section 1\n\n" + "word " * 50 + "...(continued)\n", encoding="utf-8"
+    )
+
+    result = validate_formatted_file(base_name)
+
+    assert not result.passed
+    assert "YAML file missing front matter" in result.errors
+    assert "Found truncation marker: ...(continued)" in result.errors
+    assert "File may end mid-sentence (no terminal punctuation)" in result.warnings
+
+
+def test_validate_blog_warns_on_missing_headers(tmp_path, monkeypatch):
+    base_name = "Completeness-Test"
+    project_dir = _project_dir(tmp_path, monkeypatch, base_name)
+    (project_dir / f"{base_name}{config.SUFFIX_BLOG}").write_text(
+        "Plain text without headings.\n", encoding="utf-8"
+    )
+
+    result = validate_blog(base_name)
+
+    assert "No H1 title found" in result.warnings
+    assert "No H2 headers found - may lack structure" in result.warnings
+    assert "Word count: 4" in result.info
+
+
+def test_project_entries_lists_directory_once(tmp_path, monkeypatch):
+    base_name = "Completeness-Test"
+    project_dir = _project_dir(tmp_path, monkeypatch, base_name)
+    (project_dir / f"{base_name}{config.SUFFIX_BLOG}").write_text("x", encoding="utf-8")
+
+    entries = _project_entries(base_name)
+
+    assert list(entries) == [f"{base_name}{config.SUFFIX_BLOG}"]
+    assert _project_entries("Missing-Project") == {}
+
+
+def test_validate_all_reports_missing_project(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(config, "PROJECTS_DIR", tmp_path / "projects")
+
+    results, return_code = validate_all("Missing-Project")
+    out = capsys.readouterr().out
+
+    assert out.startswith("=" * 80 + "\nCOMPLETENESS VALIDATION: Missing-Project\n")
+    assert "\n❌ FAIL - Formatted Transcript\n" in out
+    assert out.endswith("❌ VALIDATION FAILED (0/4 passed)\n" + "=" * 80 + "\n")
+
+    assert return_code == 1
+    assert list(results) == ["formatted", "core_outputs", "terms", "blog"]
+    assert results["formatted"].errors == [
+        f"File not found: Missing-Project{config.SUFFIX_FORMATTED}"
+    ]
+    assert not any(r.passed for r in results.values())
+
+
+def test_main_parses_argv_and_reports_failure(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(config, "PROJECTS_DIR", tmp_path / "projects")
+
+    assert main(["Missing-Project"]) == 1
+    assert main(["Missing-Project", "--strict"]) == 1
+    assert "COMPLETENESS VALIDATION: Missing-Project" in capsys.readouterr().out
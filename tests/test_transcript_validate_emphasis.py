@@ -0,0 +1,224 @@
+from rapidfuzz import fuzz
+
+import config
+import transcript_validate_emphasis
+from transcript_validate_emphasis import (
+    _best_region_match,
+    build_trigram_index,
+    find_best_match,
+    normalize_text,
+    validate_emphasis_items,
+)
+
+TRANSCRIPT = (
+    "## Section 1\n\n"
+    "**Speaker 1:** [00:01:10] The family system responds to anxiety in "
+    "predictable ways [sic] over many generations. People pull together when "
+    "pressure rises, and individuality gives way to togetherness.\n"
+)
+TRANSCRIPT_NORMALIZED = normalize_text(TRANSCRIPT)
+
+
+def test_normalize_text_strips_tags_sic_timestamps_and_punctuation():
+    assert normalize_text("**Speaker 1:** Hello, [sic] (hi) world [00:00:01]!") == (
+        "hello world"
+    )
+
+
+def test_normalize_text_removes_inline_tags_and_sic_without_a_space():
+    assert normalize_text("word[sic]s") == "words"
+    assert normalize_text("fam**Speaker 2:**ily sys<strong>Dave:</strong>tem") == (
+        "family system"
+    )
+    assert normalize_text("a[00:00:01]b") == "a b"
+
+
+def test_find_best_match_exact():
+    ratio, match, _ = find_best_match(
+        "people pull together when pressure rises", TRANSCRIPT_NORMALIZED
+    )
+    assert ratio == 1.0
+    assert match == "people pull together when pressure rises"
+
+
+def test_find_best_match_fuzzy_returns_aligned_text():
+    ratio, match, _ = find_best_match(
+        "the family system reacts to anxiety in predictable ways", TRANSCRIPT_NORMALIZED
+    )
+    assert 0.85 <= ratio < 1.0
+    assert "family system" in match
+
+
+def test_find_best_match_below_threshold():
+    ratio, match, _ = find_best_match(
+        "completely unrelated sentence about engines and wheels", TRANSCRIPT_NORMALIZED
+    )
+    assert ratio < 0.85
+    assert match is None
+
+
+def test_find_best_match_with_trigram_index_scores_like_full_scan():
+    index = build_trigram_index(TRANSCRIPT_NORMALIZED)
+    assert index["people pull together"] == [TRANSCRIPT_NORMALIZED.index("people")]
+
+    needle = "the family system reacts to anxiety in predictable ways"
+    ratio, match, _ = find_best_match(needle, TRANSCRIPT_NORMALIZED, trigram_index=index)
+    assert ratio == find_best_match(needle, TRANSCRIPT_NORMALIZED)[0]
+    assert match.startswith("the family system")
+
+
+def test_find_best_match_trigram_region_does_not_hide_a_better_match():
+    haystack = normalize_text(
+        "The family system responds to anxiety in predictable ways. Later on. "
+        "Teh family system reacts to anxiety in predictable ways over time."
+    )
+    index = build_trigram_index(haystack)
+    needle = "the family system reacts to anxiety in predictable ways"
+
+    ratio, match, _ = find_best_match(needle, haystack, trigram_index=index)
+
+    assert ratio >= 0.95
+    assert ratio == find_best_match(needle, haystack)[0]
+    assert match.startswith("teh family system reacts")
+
+
+def test_find_best_match_exact_prefix_scores_its_region():
+    ratio, match, _ = find_best_match(
+        "people pull together when pressure rises and individuality gives in",
+        TRANSCRIPT_NORMALIZED,
+    )
+    assert 0.85 <= ratio < 1.0
+    assert match.startswith("people pull together when pressure rises")
+
+
+def test_find_best_match_exact_prefix_does_not_hide_a_better_match():
+    haystack = normalize_text(
+        "People pull together when pressure rises and everyone just transforms. "
+        "Later. Peeple pull together when pressure rises and everyone just conforms."
+    )
+    needle = "people pull together when pressure rises and everyone just conforms"
+
+    ratio, match, _ = find_best_match(needle, haystack)
+
+    assert ratio >= 0.95
+    assert match.startswith("peeple pull together")
+
+
+def test_best_region_match_stops_at_first_near_perfect_region(monkeypatch):
+    calls = []
+    real = fuzz.partial_ratio_alignment
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(fuzz, "partial_ratio_alignment", counting)
+    haystack = "alpha beta gamma delta alpha beta gamma delta"
+
+    ratio, match, end = _best_region_match("alpha beta gamma", haystack, (0, 23))
+
+    assert ratio == 1.0
+    assert match == "alpha beta gamma"
+    assert end == len("alpha beta gamma")
+    assert len(calls) == 1
+
+
+def test_find_best_match_uses_hint_region_before_full_scan(monkeypatch):
+    haystack = normalize_text("filler words " * 200 + TRANSCRIPT)
+    hint = haystack.index("the family system")
+    needle = "family system responds to anxiety in predictble ways"
+    scanned = []
+    real = fuzz.partial_ratio_alignment
+
+    def recording(needle_arg, haystack_arg, *args, **kwargs):
+        scanned.append(len(haystack_arg))
+        return real(needle_arg, haystack_arg, *args, **kwargs)
+
+    monkeypatch.setattr(fuzz, "partial_ratio_alignment", recording)
+
+    ratio, match, end = find_best_match(needle, haystack, hint=hint)
+
+    assert ratio >= 0.98
+    assert "system responds" in match
+    assert haystack[:end].endswith(match)
+    assert max(scanned) < len(haystack)
+
+
+def test_find_best_match_hint_region_does_not_hide_a_better_match():
+    haystack = normalize_text(
+        "The family system reacts to worry in predictable ways. "
+        + "filler words " * 200
+        + "The family system reacts to anxiety in predictible ways."
+    )
+    needle = "family system reacts to anxiety in predictable ways"
+
+    ratio, match, end = find_best_match(needle, haystack, hint=0)
+
+    assert ratio >= 0.95
+    assert "anxiety" in match
+    assert end > 2000
+
+
+def _write_project(tmp_path, monkeypatch, emphasis_md, transcript):
+    base_name = "Emphasis-Validate-Test"
+    project_dir = tmp_path / "projects" / base_name
+    project_dir.mkdir(parents=True)
+    formatted_path = project_dir / f"{base_name}{config.SUFFIX_FORMATTED}"
+    formatted_path.write_text(transcript, encoding="utf-8")
+    (project_dir / f"{base_name}{config.SUFFIX_EMPHASIS}").write_text(
+        emphasis_md, encoding="utf-8"
+    )
+    monkeypatch.setattr(config, "PROJECTS_DIR", tmp_path / "projects")
+    return base_name, formatted_path
+
+
+def test_validate_emphasis_items_exact_partial_and_missing(tmp_path, monkeypatch, capsys):
+    emphasis_md = (
+        "## Emphasized Items\n\n"
+        '- **Pressure:** "People pull together when pressure rises"\n'
+        '- **Anxiety:** "The family system reacts to anxiety in predictable ways"\n'
+        '- **Engines:** "Completely unrelated sentence about engines and wheels"\n'
+    )
+    base_name, formatted_path = _write_project(
+        tmp_path, monkeypatch, emphasis_md, TRANSCRIPT
+    )
+
+    validate_emphasis_items(base_name, formatted_path)
+    out = capsys.readouterr().out
+
+    assert "✅ Exact matches: 1" in out
+    assert "⚠️  Partial matches: 1" in out
+    assert "❌ Not found: 1" in out
+
+
+def test_validate_emphasis_items_handles_empty_transcript(
+    tmp_path, monkeypatch, capsys
+):
+    emphasis_md = '## Emphasized Items\n\n- **Pressure:** "People pull together"\n'
+    base_name, formatted_path = _write_project(tmp_path, monkeypatch, emphasis_md, "")
+
+    validate_emphasis_items(base_name, formatted_path)
+
+    assert "❌ Not found: 1" in capsys.readouterr().out
+
+
+def test_validate_emphasis_items_matches_line_broken_quote_without_normalizing(
+    tmp_path, monkeypatch, capsys
+):
+    emphasis_md = (
+        "## Emphasized Items\n\n"
+        '- **Pressure:** "People pull together when pressure rises"\n'
+    )
+    transcript = "## Section 1\n\nPeople pull together when\npressure rises.\n"
+    base_name, formatted_path = _write_project(
+        tmp_path, monkeypatch, emphasis_md, transcript
+    )
+
+    def fail(_text):
+        raise AssertionError("normalize_text should not be needed")
+
+    monkeypatch.setattr(transcript_validate_emphasis, "normalize_text", fail)
+
+    validate_emphasis_items(base_name, formatted_path)
+
+    assert "✅ Exact matches: 1" in capsys.readouterr().out
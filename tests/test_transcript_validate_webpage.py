@@ -0,0 +1,144 @@
+import sys
+from unittest.mock import patch
+
+import pytest
+from bs4 import BeautifulSoup
+
+import config
+import transcript_validate_webpage
+from transcript_validate_webpage import (
+    count_sections_in_formatted,
+    count_sections_in_html,
+    extract_html_metadata,
+    extract_html_simple_metadata,
+    extract_topics_themes_metadata,
+    find_missing_bowen_items,
+    find_missing_emphasis_items,
+    normalize_for_comparison,
+)
+
+SIMPLE_HTML = """
+<html><body><div class="content">
+<h2>Abstract</h2><p>abs</p>
+<h2>Section 1</h2>
+<p><mark class="bowen-ref" title="Bowen Reference: Fusion; Cutoff">q1</mark>
+<mark class="emphasis" title="Emphasized: Anxiety (90%) | score">q2</mark></p>
+<h2>Section 2</h2><h2>Key Terms</h2>
+</div></body></html>
+"""
+
+
+def test_count_sections_in_formatted_skips_front_matter(tmp_path):
+    formatted = tmp_path / "formatted.md"
+    formatted.write_text(
+        "---\ntitle: x\n---\n## Section 1\ntext\n### Sub\n## \n##x\n## Section 2\nmore\n",
+        encoding="utf-8",
+    )
+    assert count_sections_in_formatted(formatted) == (2, ["Section 1", "Section 2"])
+
+
+def test_normalize_for_comparison():
+    assert normalize_for_comparison("  The  Family,\nSystem: a Unit!? ") == "the family system a unit"
+    # Whitespace is collapsed before punctuation is dropped, as it always has been.
+    assert normalize_for_comparison("self , other") == "self  other"
+    assert normalize_for_comparison(" . Abstract") == "abstract"
+
+
+def test_extract_topics_themes_metadata_counts_sections(tmp_path):
+    base_name = "Meta - Author - 2025-01-01"
+    project_dir = tmp_path / base_name
+    project_dir.mkdir()
+    (project_dir / f"{base_name}{config.SUFFIX_TOPICS}").write_text(
+        "## **Key Topics**\n\n### Anxiety\nText.\n### Triangles\nText.\n\n## Other\n### Not a topic\n",
+        encoding="utf-8",
+    )
+    (project_dir / f"{base_name}{config.SUFFIX_STRUCTURAL_THEMES}").write_text(
+        "## Structural Themes\n\n1. **Fusion** - text\n2. **Cutoff** - text\n",
+        encoding="utf-8",
+    )
+    (project_dir / f"{base_name}{config.SUFFIX_INTERPRETIVE_THEMES}").write_text(
+        "## Interpretive Themes\n\n### Emotional Process\n",
+        encoding="utf-8",
+    )
+    (project_dir / f"{base_name}{config.SUFFIX_KEY_TERMS}").write_text(
+        "---\nk: v\n---\n## Key Terms\n\n### Differentiation\nDef.\n---\n### After rule\n",
+        encoding="utf-8",
+    )
+
+    with patch.object(config, "PROJECTS_DIR", tmp_path):
+        meta = extract_topics_themes_metadata(base_name)
+
+    assert meta["topics_list"] == ["Anxiety", "Triangles"]
+    assert meta["themes_list"] == ["Fusion", "Cutoff", "Emotional Process"]
+    assert meta["key_terms_list"] == ["Differentiation"]
+    assert meta["has_abstract"] is False
+
+
+def test_html_helpers_share_one_parsed_soup():
+    soup = BeautifulSoup(SIMPLE_HTML, "html.parser")
+    assert count_sections_in_html(soup) == (2, ["Section 1", "Section 2"])
+    assert find_missing_bowen_items(
+        [("Fusion", "a"), ("Cutoff", "b"), ("Triangles", "c")], soup
+    ) == ["Triangles"]
+    assert find_missing_emphasis_items(
+        [("Anxiety (90%)", "a"), ("Calm (85%)", "b")], soup
+    ) == ["Calm (85%)"]
+
+
+def test_simple_metadata_collects_highlight_labels():
+    meta = extract_html_simple_metadata(BeautifulSoup(SIMPLE_HTML, "html.parser"))
+    assert meta["bowen_highlights"] == 1
+    assert meta["bowen_labels"] == ["Fusion", "Cutoff"]
+    assert meta["emphasis_highlights"] == 1
+    assert meta["emphasis_labels"] == ["Anxiety (90%)"]
+
+
+def test_find_missing_items_when_highlight_count_matches_source():
+    # Two sources, two distinct highlights, but one highlight is not a source
+    # label: equal counts must not be taken to mean nothing is missing.
+    soup = BeautifulSoup(
+        '<mark class="emphasis" title="Emphasized: A">a</mark>'
+        '<mark class="emphasis" title="Emphasized: C">c</mark>',
+        "html.parser",
+    )
+    assert find_missing_emphasis_items([("A", "q"), ("B", "q")], soup) == ["B"]
+
+
+def test_sidebar_metadata_counts_exclude_legend_marks():
+    html = """
+<style>mark.bowen-ref { } mark.emphasis.bowen-ref { }</style>
+<aside class="sidebar"><h2>Abstract</h2><p>Text</p></aside>
+<main class="main-content">
+<div class="legend"><mark class="bowen-ref">Bowen References</mark>
+<mark class="emphasis">Emphasis</mark></div>
+<div class="transcript"><p>
+<mark class="bowen-ref" title="Bowen Reference: Fusion">a</mark>
+<mark class="emphasis" title="Emphasized: Anxiety | 90%">b</mark>
+</p></div></main>
+"""
+    meta = extract_html_metadata(BeautifulSoup(html, "html.parser"))
+    assert meta["bowen_highlights"] == 1
+    assert meta["emphasis_highlights"] == 1
+    assert meta["abstract_text"] == "Text"
+
+
+def test_main_validates_each_base_name_in_order(tmp_path, monkeypatch, capsys):
+    names = ["B - X - 2025-01-01", "A - X - 2025-01-01"]
+    (tmp_path / names[1]).mkdir()
+    monkeypatch.setattr(
+        sys, "argv", ["transcript_validate_webpage.py", *names, "--simple"]
+    )
+
+    with (
+        patch.object(config, "PROJECTS_DIR", tmp_path),
+        pytest.raises(SystemExit) as exc,
+    ):
+        transcript_validate_webpage.main()
+
+    assert exc.value.code == 1
+    out = capsys.readouterr().out
+    assert out.index(f"WEBPAGE VALIDATION: {names[0]}") < out.index(
+        f"WEBPAGE VALIDATION: {names[1]}"
+    )
+    assert out.count("(Simple Single-Column Layout)") == 2
+    assert out.count("MISSING FILES") == 2
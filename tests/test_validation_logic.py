@@ -91,5 +91,85 @@ class TestValidationLogic(unittest.TestCase):
         self.assertEqual(result['mismatch_count'], 1)
         self.assertEqual(result['mismatches'][0]['a_word'], 'two')
 
+    def test_compare_transcripts_counts_only_contentful_b_words(self):
+        """Tokens that normalize to nothing are dropped from B but kept in A."""
+
+        raw = "one -- two"
+        formatted = "**one** — two ..."
+
+        result = _compare_transcripts(
+            raw, formatted, set(), max_lookahead=5, max_mismatch_ratio=1.0, max_mismatches=None
+        )
+
+        self.assertEqual(result['a_word_count'], 3)
+        self.assertEqual(result['b_word_count'], 2)
+        self.assertEqual(result['checked_words'], 2)
+        self.assertEqual(result['mismatch_count'], 0)
+
+    def test_compare_transcripts_lookahead_window_is_inclusive(self):
+        """A word exactly max_lookahead ahead in B is found; one further is not."""
+
+        result = _compare_transcripts(
+            "alpha beta", "xx yy alpha beta", set(), max_lookahead=2, max_mismatch_ratio=1.0, max_mismatches=None
+        )
+        self.assertEqual(result['mismatch_count'], 0)
+
+        result = _compare_transcripts(
+            "alpha beta", "xx yy alpha beta", set(), max_lookahead=1, max_mismatch_ratio=1.0, max_mismatches=None
+        )
+        self.assertEqual(result['mismatch_count'], 2)
+
+    def test_compare_transcripts_ratio_stop_fires_when_warmup_ends(self):
+        """The ratio check trips on the word that ends the warm-up, even a match."""
+
+        result = _compare_transcripts(
+            "x a b c d e f g h i", "y a b c d e f g h i", set(),
+            max_lookahead=1, max_mismatch_ratio=0.2, max_mismatches=None
+        )
+
+        self.assertEqual(result['stopped_reason'], 'mismatch_ratio')
+        self.assertEqual(result['checked_words'], 3)
+        self.assertEqual(result['mismatch_count'], 1)
+
+    def test_compare_transcripts_mismatch_records_are_plain_dicts(self):
+        """validate_format and callers read mismatches as dicts with fixed keys."""
+
+        result = _compare_transcripts(
+            "alpha x beta gamma delta extra words", "alpha beta zeta delta", set(),
+            max_lookahead=5, max_mismatch_ratio=1.0, max_mismatches=None
+        )
+
+        self.assertEqual(result['mismatches'], [
+            {'a_index': 1, 'a_word': 'x', 'b_index': 1, 'b_word': 'beta',
+             'reason': 'Skipped in A (deletion in B)'},
+            {'a_index': 3, 'a_word': 'gamma', 'b_index': 2, 'b_word': 'zeta',
+             'reason': 'Mismatch'},
+            {'a_index': 5, 'a_word': 'extra', 'b_index': None, 'b_word': None,
+             'reason': 'B exhausted'},
+        ])
+        self.assertEqual(result['stopped_reason'], 'B_exhausted')
+
+    def test_compare_transcripts_skip_words_are_not_checked(self):
+        """Skip words in A are neither checked nor reported, even at the end."""
+
+        result = _compare_transcripts(
+            "um the uh family um", "the family", {"um", "uh"}, max_lookahead=5, max_mismatch_ratio=1.0, max_mismatches=None
+        )
+
+        self.assertEqual(result['a_word_count'], 5)
+        self.assertEqual(result['checked_words'], 2)
+        self.assertEqual(result['mismatch_count'], 0)
+        self.assertIsNone(result['stopped_reason'])
+
+    def test_compare_transcripts_lookahead_can_land_on_skip_word(self):
+        """Skip words are passed over in A but still anchor the A-side lookahead."""
+
+        result = _compare_transcripts(
+            "x so beta", "so beta", {"so"}, max_lookahead=5, max_mismatch_ratio=1.0, max_mismatches=None
+        )
+
+        self.assertEqual(result['mismatch_count'], 1)
+        self.assertEqual(result['mismatches'][0]['reason'], 'Skipped in A (deletion in B)')
+
 if __name__ == '__main__':
     unittest.main()
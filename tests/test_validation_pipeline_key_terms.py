@@ -2,6 +2,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 import config
+from transcript_utils import normalize_text
 from validation_pipeline import _parse_key_terms_section, validate_key_terms_fidelity
 
 
@@ -62,3 +63,28 @@ def test_validate_key_terms_fidelity_writes_report_and_detects_failures(tmp_path
 
     assert ok is False
     assert "FAIL" in report.read_text(encoding="utf-8")
+
+
+def test_validate_key_terms_fidelity_uses_supplied_transcript(tmp_path):
+    base_name = "Sample - Author - 2025-01-01"
+    project_dir = tmp_path / base_name
+    project_dir.mkdir(parents=True, exist_ok=True)
+    (project_dir / f"{base_name}{config.SUFFIX_KEY_TERMS}").write_text(
+        "## Key Terms\n\n### Differentiation of Self\nThe ability to separate thinking from feeling.\n",
+        encoding="utf-8",
+    )
+    transcript = "Differentiation of self is the ability to separate thinking from feeling."
+
+    # The formatted file is never created: the caller's text must be used.
+    with patch.object(config, "PROJECTS_DIR", tmp_path):
+        ok = validate_key_terms_fidelity(
+            project_dir / "missing.md",
+            base_name,
+            _Logger(),
+            transcript,
+            normalize_text(transcript, aggressive=True),
+        )
+
+    assert ok is True
+    report = project_dir / f"{base_name}{config.SUFFIX_KEY_TERMS_VAL}"
+    assert "EXACT" in report.read_text(encoding="utf-8")
@@ -2,7 +2,10 @@ from pathlib import Path
 from unittest.mock import patch
 
 import config
-from validation_pipeline import validate_topics_lightweight
+from validation_pipeline import (
+    _keyword_grounding_ratio,
+    validate_topics_lightweight,
+)
 
 
 class _Logger:
@@ -100,3 +103,10 @@ def test_validate_topics_lightweight_handles_paraphrased_topics(tmp_path):
     report = (project_dir / f"{base_name}{config.SUFFIX_TOPICS_VAL}").read_text(encoding="utf-8")
     assert ok is True
     assert "FAIL" not in report
+
+
+def test_keyword_grounding_ratio_uses_precomputed_haystack_keywords():
+    hay_words = {"chronic", "anxiety", "disturbs", "regulation", "family", "system"}
+    assert _keyword_grounding_ratio("chronic anxiety and regulation", hay_words) == 1.0
+    assert _keyword_grounding_ratio("family cohesion", hay_words) == 0.5
+    assert _keyword_grounding_ratio("and the", hay_words) == 0.0
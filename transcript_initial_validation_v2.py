@@ -301,7 +301,9 @@ class TranscriptValidatorV2:
             # We search in a generalized way since we don't have the exact chunk context here easily 
             # (although we could pass it if we kept map). 
             # For V2 global check, we can use the util.
-            start, end, ratio = transcript_utils.find_text_in_content(original, full_text)
+            start, end, ratio = transcript_utils.find_text_in_normalized(
+                transcript_utils.normalize_text(original), full_text_norm
+            )
             
             if ratio >= config.VALIDATION_FUZZY_HALLUCINATION:
                 valid.append(f)
@@ -10,8 +10,9 @@ import re
 import time
 from copy import deepcopy
 from datetime import datetime
-from difflib import SequenceMatcher
+from functools import lru_cache
 from html import unescape
+from itertools import islice
 from pathlib import Path
 from typing import Any, Optional
 
@@ -24,6 +25,8 @@ from anthropic import (
     NotFoundError,
     RateLimitError,
 )
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import Indel
 
 import config
 
@@ -32,6 +35,13 @@ import model_specs
 
 LARGE_INPUT_CACHE_THRESHOLD_CHARS = 10000
 
+# Whitespace-delimited token; used to index word spans in normalized text.
+_WORD_RE = re.compile(r'\S+')
+
+# Minimum block size (chars) for the partial_ratio screen that precedes the
+# word-window scan in find_text_in_normalized.
+_FUZZY_SCREEN_BLOCK_CHARS = 2048
+
 
 # Configure logging
 def setup_logging(script_name: str) -> logging.Logger:
@@ -979,6 +989,22 @@ def check_token_budget(text: str, max_tokens: int, logger: Optional[logging.Logg
 # to avoid hardcoding patterns across multiple files.
 
 
+# Any markdown header; the hash run gives its level.
+_SECTION_HEADER_RE = re.compile(r'^(#+)\s', re.MULTILINE)
+
+
+@lru_cache(maxsize=128)
+def _section_start_pattern(section_name: str) -> re.Pattern:
+    """Compile (once per name) the pattern matching a section's header line."""
+    escaped_name = re.escape(section_name).replace(r'\ ', r'\s+')
+    # Matches: start of line, optional hash, optional bold/markup, optional number, name, anything, end of line
+    # Capture group 1: The hashes (if any)
+    return re.compile(
+        rf'^(#*)\s*(?:[\*\_]+)?(?:\d+\.?\s*)?{escaped_name}\b.*?$',
+        re.MULTILINE | re.IGNORECASE
+    )
+
+
 def extract_section(content: str, section_name: str, allow_bold: bool = True) -> str:
     """
     Extract a markdown section by name, correctly handling nested subsections.
@@ -992,17 +1018,8 @@ def extract_section(content: str, section_name: str, allow_bold: bool = True) ->
     Returns:
         The section content (stripped), or empty string if not found
     """
-    escaped_name = re.escape(section_name).replace(r'\ ', r'\s+')
-
     # 1. Find the start of the section
-    # Matches: start of line, optional hash, optional bold/markup, optional number, name, anything, end of line
-    # Capture group 1: The hashes (if any)
-    start_pattern = re.compile(
-        rf'^(#*)\s*(?:[\*\_]+)?(?:\d+\.?\s*)?{escaped_name}\b.*?$',
-        re.MULTILINE | re.IGNORECASE
-    )
-
-    match = start_pattern.search(content)
+    match = _section_start_pattern(section_name).search(content)
     if not match:
         return ''
 
@@ -1013,9 +1030,7 @@ def extract_section(content: str, section_name: str, allow_bold: bool = True) ->
 
     # 2. Find the end of the section
     # Iterate through all subsequent headers to find one that closes this section
-    header_pattern = re.compile(r'^(#+)\s', re.MULTILINE)
-
-    for next_header in header_pattern.finditer(content, start_pos):
+    for next_header in _SECTION_HEADER_RE.finditer(content, start_pos):
         next_hashes = next_header.group(1)
         next_level = len(next_hashes)
 
@@ -1329,6 +1344,20 @@ def markdown_to_html(text: str) -> str:
 # TEXT PROCESSING UTILITIES
 # ============================================================================
 
+# Patterns used by normalize_text, compiled once at import.
+_NORM_TAG_RE = re.compile(r'<[^>]+>')
+# Matches n:nn, nn:nn, n:nn:nn, nn:nn:nn with optional brackets/parens
+_NORM_TIMESTAMP_RE = re.compile(
+    r'[\[\(]?\b\d+:\d{2}(?:\d{2})?(?:[ap]m)?[\]\)]?', re.IGNORECASE)
+_NORM_BARE_SECONDS_RE = re.compile(r'(?:^|\s)[\[\(]?:\d{2}\b[\]\)]?')
+_NORM_MD_SPEAKER_RE = re.compile(r'\*\*[^*]+:\*\*\s*')
+_NORM_PLAIN_SPEAKER_RE = re.compile(
+    r'(Speaker \d+|Unknown Speaker):\s*', re.IGNORECASE)
+# Punctuation replaced by spaces in aggressive mode (one C-level pass).
+_NORM_PUNCT_TABLE = str.maketrans(dict.fromkeys('.,!?;:—-\'"()', ' '))
+_NORM_WORD_RE = re.compile(r'\S+')
+
+
 def normalize_text(text: str, aggressive: bool = False) -> str:
     """
     Normalize text for comparison.
@@ -1345,25 +1374,21 @@ def normalize_text(text: str, aggressive: bool = False) -> str:
     text = unescape(text)
 
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', ' ', text)
+    text = _NORM_TAG_RE.sub(' ', text)
 
     # Remove timestamps (e.g. [00:00:00], 10:00, 1:10:10)
-    # Matches n:nn, nn:nn, n:nn:nn, nn:nn:nn with optional brackets/parens
-    text = re.sub(
-        r'[\[\(]?\b\d+:\d{2}(?:\d{2})?(?:[ap]m)?[\]\)]?', ' ', text, flags=re.IGNORECASE)
-    text = re.sub(r'(?:^|\s)[\[\(]?:\d{2}\b[\]\)]?', ' ', text)
+    text = _NORM_TIMESTAMP_RE.sub(' ', text)
+    text = _NORM_BARE_SECONDS_RE.sub(' ', text)
 
     if aggressive:
         # Remove speaker tags (Markdown and plain text)
-        text = re.sub(r'\*\*[^*]+:\*\*\s*', '', text)
-        text = re.sub(r'(Speaker \d+|Unknown Speaker):\s*',
-                      '', text, flags=re.IGNORECASE)
+        text = _NORM_MD_SPEAKER_RE.sub('', text)
+        text = _NORM_PLAIN_SPEAKER_RE.sub('', text)
         # Remove punctuation
-        text = re.sub(r'[.,!?;:—\-\'"()]', ' ', text)
+        text = text.translate(_NORM_PUNCT_TABLE)
 
     # Collapse whitespace
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
+    text = ' '.join(text.split())
     return text.lower()
 
 
@@ -1396,37 +1421,190 @@ def find_text_in_content(needle: str, haystack: str, aggressive_normalization: b
         if pos >= 0:
             return (pos, pos + len(needle), 1.0)
 
-    # Fuzzy match - try sliding window
-    needle_words = needle_normalized.split()
-    haystack_words = haystack_normalized.split()
-    needle_len = len(needle_words)
+    return find_text_in_normalized(needle_normalized, haystack_normalized)
 
-    best_ratio = 0
-    best_pos = None
 
-    for i in range(len(haystack_words) - needle_len + 1):
-        window = ' '.join(haystack_words[i:i + needle_len])
-        ratio = SequenceMatcher(None, needle_normalized, window).ratio()
+def find_text_in_normalized(needle_normalized: str, haystack_normalized: str) -> tuple[Optional[int], Optional[int], float]:
+    """
+    Find an already-normalized needle in an already-normalized haystack.
+
+    Same matching as find_text_in_content, for callers that search many
+    needles in one document and want to normalize the document only once.
+    Both arguments must come from normalize_text with the same settings.
 
+    Args:
+        needle_normalized: The normalized text to search for.
+        haystack_normalized: The normalized text to search within.
+
+    Returns:
+        A tuple containing (start_pos, end_pos, match_ratio), with positions
+        in haystack_normalized. Returns (None, None, 0) if no good match is found.
+    """
+    pos = haystack_normalized.find(needle_normalized)
+    if pos != -1:
+        return (pos, pos + len(needle_normalized), 1.0)
+
+    # Near-verbatim quotes usually differ only near the end (a stray word or
+    # punctuation). Locate a leading prefix with str.find and score the word
+    # window starting there, the same window the sliding scan would score.
+    # Only a near-perfect score skips the scan; anything lower is kept as a
+    # candidate for the scan to beat.
+    needle_char_len = len(needle_normalized)
+    needle_len = len(needle_normalized.split())
+    best_ratio = 0
+    best_span = None
+    for cut in (needle_char_len * 3 // 4, needle_char_len // 2):
+        if not cut:
+            continue
+        pos = haystack_normalized.find(needle_normalized[:cut])
+        if pos == -1:
+            continue
+        window_start = haystack_normalized.rfind(' ', 0, pos) + 1
+        window_spans = [m.span() for m in islice(
+            _WORD_RE.finditer(haystack_normalized, window_start), needle_len)]
+        if len(window_spans) < needle_len:
+            continue
+        window_end = window_spans[-1][1]
+        ratio = Indel.normalized_similarity(
+            needle_normalized, haystack_normalized[window_start:window_end])
+        if ratio >= config.FUZZY_MATCH_EARLY_STOP:
+            return (window_start, window_end, ratio)
         if ratio > best_ratio and ratio >= config.FUZZY_MATCH_THRESHOLD:
             best_ratio = ratio
-            best_pos = i
-            # Early termination for near-perfect match
-            if ratio >= config.FUZZY_MATCH_EARLY_STOP:
+            best_span = (window_start, window_end)
+
+    # Coarse screen: partial_ratio scores the best needle-length character
+    # window of a block in C. A word window with Indel similarity >= T is at
+    # most max_window chars long, and a needle-length window overlapping it
+    # scores at least 3 - 2/T. Blocks are scored together with max_window
+    # chars of overlap, so a block scoring below that floor holds no start
+    # of a matching window and its words need not be scanned.
+    threshold = config.FUZZY_MATCH_THRESHOLD
+    hay_len = len(haystack_normalized)
+    max_window = int(needle_char_len * (2 / threshold - 1)) + 1
+    if hay_len < needle_char_len:
+        # The floor needs a haystack at least as long as the needle.
+        runs = [(0, hay_len)]
+    else:
+        floor = 100 * (3 - 2 / threshold) - 1e-6
+        block = max(_FUZZY_SCREEN_BLOCK_CHARS, 4 * max_window)
+        runs = []
+        for block_start in range(0, hay_len, block):
+            seg_end = min(hay_len, block_start + block + max_window)
+            seg_start = min(block_start, max(0, seg_end - needle_char_len))
+            score = fuzz.partial_ratio(
+                needle_normalized, haystack_normalized[seg_start:seg_end])
+            if score < floor:
+                continue
+            if runs and runs[-1][1] == block_start:
+                runs[-1] = (runs[-1][0], block_start + block)
+            else:
+                runs.append((block_start, block_start + block))
+
+    # Fuzzy match - sliding window over the word starts each run covers.
+    # Normalized text is single-space separated, so a window of words is a
+    # plain slice between word spans; no per-window list/join is needed.
+    for run_start, run_end in runs:
+        # Snap both ends to word boundaries so no word is cut short; words
+        # beyond run_end + max_window only end windows too long to match.
+        scan_start = haystack_normalized.rfind(' ', 0, run_start) + 1
+        scan_end = haystack_normalized.find(' ', min(hay_len, run_end + max_window))
+        if scan_end == -1:
+            scan_end = hay_len
+        spans = [m.span() for m in _WORD_RE.finditer(
+            haystack_normalized, scan_start, scan_end)]
+
+        for i in range(len(spans) - needle_len + 1):
+            if spans[i][0] >= run_end:
                 break
-
-    if best_pos is not None:
-        # Approximate position in original text
-        # This is rough but works for highlighting
-        words_before = ' '.join(haystack_words[:best_pos])
-        approx_start = len(words_before)
-        approx_end = approx_start + \
-            len(' '.join(haystack_words[best_pos:best_pos + needle_len]))
-        return (approx_start, approx_end, best_ratio)
+            window = haystack_normalized[spans[i][0]:spans[i + needle_len - 1][1]]
+            # Indel similarity is the LCS-based counterpart of difflib's ratio,
+            # computed bit-parallel in C.
+            ratio = Indel.normalized_similarity(needle_normalized, window)
+
+            if ratio > best_ratio and ratio >= threshold:
+                best_ratio = ratio
+                best_span = (spans[i][0], spans[i + needle_len - 1][1])
+                # Early termination for near-perfect match
+                if ratio >= config.FUZZY_MATCH_EARLY_STOP:
+                    return (best_span[0], best_span[1], best_ratio)
+
+    if best_span is not None:
+        # Position in the normalized text; rough but works for highlighting
+        return (best_span[0], best_span[1], best_ratio)
 
     return (None, None, 0)
 
 
+def find_best_match_in_html(needle: str, haystack_normalized: str, threshold: float = 0.85) -> tuple[float, Optional[str]]:
+    """
+    Find the best matching substring in normalized HTML content.
+
+    The haystack must come from normalize_text(..., aggressive=True); the
+    needle is normalized the same way here. Windows of the needle's word
+    count are scored with Indel similarity, the LCS-based counterpart of
+    difflib's ratio, computed in C.
+
+    Returns:
+        (ratio, match_text): match_text is the needle itself on an exact
+        hit, otherwise the best-scoring window (None if the needle has more
+        words than the haystack).
+    """
+    return find_best_matches_in_html([needle], haystack_normalized, threshold)[0]
+
+
+def find_best_matches_in_html(needles: list[str], haystack_normalized: str, threshold: float = 0.85) -> list[tuple[float, Optional[str]]]:
+    """
+    Batch form of find_best_match_in_html, one result per needle.
+
+    Haystack windows are built once per distinct needle word count and
+    shared by every needle of that length; each needle is then scanned
+    against them in a single rapidfuzz call. Windows are sliced straight
+    out of the haystack at its word offsets, which equals joining
+    the words because normalized text is single-space separated.
+    """
+    word_starts = word_ends = None
+    windows_by_len: dict[int, list[str]] = {}
+    results = []
+
+    for needle in needles:
+        needle_normalized = normalize_text(needle, aggressive=True)
+
+        if needle_normalized in haystack_normalized:
+            results.append((1.0, needle))
+            continue
+
+        # Fuzzy match
+        if word_starts is None:
+            # Tokenize the haystack once, on the first needle that needs it.
+            spans = [m.span() for m in _NORM_WORD_RE.finditer(haystack_normalized)]
+            word_starts = [start for start, _ in spans]
+            word_ends = [end for _, end in spans]
+        needle_len = len(needle_normalized.split())
+
+        if needle_len > len(word_starts):
+            results.append((0.0, None))
+            continue
+
+        windows = windows_by_len.get(needle_len)
+        if windows is None:
+            windows = [
+                haystack_normalized[start:end]
+                for start, end in zip(word_starts, word_ends[needle_len - 1:])
+            ]
+            windows_by_len[needle_len] = windows
+
+        # Ties keep the earliest window, as a left-to-right scan would.
+        best_match, best_ratio, _ = process.extractOne(
+            needle_normalized, windows, scorer=Indel.normalized_similarity)
+        if best_ratio > 0:
+            results.append((best_ratio, best_match))
+        else:
+            results.append((0, None))
+
+    return results
+
+
 def delete_logs(logger=None) -> bool:
     """Permanently delete log files and token usage CSV."""
     if logger is None:
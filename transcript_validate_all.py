@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Run the deterministic grounding validators in one process: topics, key
+terms, and HTML highlights, for one or more transcripts.
+Running them together pays interpreter/import startup once, and the
+formatted transcript is read and normalized once and handed to both the
+topic and key-term validators.
+"""
+
+import argparse
+
+import config
+from transcript_utils import normalize_text, setup_logging, strip_yaml_frontmatter
+from transcript_validate_html_highlights import validate_html_highlights
+from validation_pipeline import validate_key_terms_fidelity, validate_topics_lightweight
+
+
+def validate_all(base_name: str, logger) -> bool:
+    """Run every grounding validator for one transcript; True if all pass."""
+    formatted_file = (
+        config.PROJECTS_DIR / base_name / f"{base_name}{config.SUFFIX_FORMATTED}"
+    )
+    if not formatted_file.exists():
+        print(f"❌ Formatted file not found: {formatted_file}")
+        return False
+
+    transcript = strip_yaml_frontmatter(formatted_file.read_text(encoding="utf-8"))
+    transcript_norm = normalize_text(transcript, aggressive=True)
+    results = [
+        validate_topics_lightweight(
+            formatted_file, base_name, logger, transcript, transcript_norm
+        ),
+        validate_key_terms_fidelity(
+            formatted_file, base_name, logger, transcript, transcript_norm
+        ),
+        validate_html_highlights(base_name, logger),
+    ]
+    return all(results)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Validate topics, key terms, and HTML highlights for one or more transcripts."
+    )
+    parser.add_argument(
+        "base_names",
+        nargs="+",
+        metavar="base_name",
+        help="Base transcript name: 'Title - Presenter - Date'",
+    )
+    args = parser.parse_args()
+
+    logger = setup_logging("validate_all")
+    results = [validate_all(base_name, logger) for base_name in args.base_names]
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
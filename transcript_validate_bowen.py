@@ -9,7 +9,11 @@ import sys
 from pathlib import Path
 
 import config
-from transcript_utils import find_text_in_content, load_bowen_references, normalize_text
+from transcript_utils import (
+    find_text_in_normalized,
+    load_bowen_references,
+    normalize_text,
+)
 
 
 def contains_attribution(text: str) -> bool:
@@ -28,9 +32,11 @@ def contains_attribution(text: str) -> bool:
 def validate_bowen_items(base_name: str, formatted_file: Path):
     """Validate all Bowen reference quotes exist in the formatted transcript."""
 
-    # Read formatted transcript
-    with open(formatted_file, "r", encoding="utf-8") as f:
-        formatted_content = f.read()
+    # Read formatted transcript in one bulk decode; a stray invalid byte
+    # should not abort validation of the whole file.
+    formatted_content = Path(formatted_file).read_text(
+        encoding="utf-8", errors="replace"
+    )
 
     # Extract quotes using the centralized loader
     quotes = load_bowen_references(base_name)
@@ -42,34 +48,41 @@ def validate_bowen_items(base_name: str, formatted_file: Path):
     print(f"Found {len(quotes)} Bowen references to validate\n")
     print("=" * 80)
 
+    # Normalize the transcript once; every quote is searched against it.
+    formatted_norm = normalize_text(formatted_content, aggressive=True)
+
     valid_count = 0
     invalid_count = 0
     partial_count = 0
     attribution_missing = 0
 
     for i, (label, quote) in enumerate(quotes, 1):
-        has_attr = contains_attribution(quote)
-        start, end, ratio = find_text_in_content(
-            quote, formatted_content, aggressive_normalization=True
-        )
-
-        print(f"\n{i}. {label}")
-        print(f"   Quote preview: {quote[:80]}...")
-        if not has_attr:
-            print("   ❌ MISSING ATTRIBUTION (quote text lacks Bowen attribution)")
+        # Collect the block for this quote and emit it with a single print.
+        lines = [f"\n{i}. {label}", f"   Quote preview: {quote[:80]}..."]
+
+        # Attribution is a cheap regex check and decides the verdict on its
+        # own, so only pay for the transcript search when it passes.
+        if not contains_attribution(quote):
+            lines.append(
+                "   ❌ MISSING ATTRIBUTION (quote text lacks Bowen attribution)"
+            )
             attribution_missing += 1
             invalid_count += 1
+            print("\n".join(lines))
             continue
 
+        quote_norm = normalize_text(quote, aggressive=True)
+        _, _, ratio = find_text_in_normalized(quote_norm, formatted_norm)
         if ratio >= 0.95:
-            print(f"   ✅ EXACT MATCH (ratio: {ratio:.2f})")
+            lines.append(f"   ✅ EXACT MATCH (ratio: {ratio:.2f})")
             valid_count += 1
         elif ratio >= config.FUZZY_MATCH_THRESHOLD:
-            print(f"   ⚠️  PARTIAL MATCH (ratio: {ratio:.2f})")
+            lines.append(f"   ⚠️  PARTIAL MATCH (ratio: {ratio:.2f})")
             partial_count += 1
         else:
-            print(f"   ❌ NOT FOUND (best ratio: {ratio:.2f})")
+            lines.append(f"   ❌ NOT FOUND (best ratio: {ratio:.2f})")
             invalid_count += 1
+        print("\n".join(lines))
 
     print("\n" + "=" * 80)
     print("\nValidation Summary:")
@@ -17,11 +17,109 @@ Checks:
 """
 
 import argparse
+import io
+import os
 import re
-from typing import Dict
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
 
 import config
 
+# Structure markers, compiled once at import. The header patterns are ASCII,
+# so they run on raw bytes without decoding.
+_H1_RE = re.compile(rb"^#\s+", re.MULTILINE)
+_H2_RE = re.compile(rb"^##\s+", re.MULTILINE)
+_TERM_BULLET_RE = re.compile(r"^-\s+\*\*", re.MULTILINE)
+_WORD_RE = re.compile(r"\S+")
+
+TRUNCATION_MARKERS = (
+    "...[truncated]",
+    "[content cut off]",
+    "...(continued)",
+    "[OUTPUT LIMIT REACHED]",
+)
+
+
+def _compile_markers(markers):
+    """Build one case-insensitive byte alternation over all markers.
+
+    Returns the pattern and a map from each marker's lowercase bytes back to
+    its canonical spelling. Alternatives are tried longest first so a marker
+    that is a prefix of another cannot shadow it at the same position.
+    """
+    pattern = re.compile(
+        b"|".join(
+            re.escape(marker.encode("ascii"))
+            for marker in sorted(markers, key=len, reverse=True)
+        ),
+        re.IGNORECASE,
+    )
+    by_lower = {marker.lower().encode("ascii"): marker for marker in markers}
+    return pattern, by_lower
+
+
+_TRUNCATION_RE, _TRUNCATION_BY_LOWER = _compile_markers(TRUNCATION_MARKERS)
+
+
+def _count_words(text: str) -> int:
+    """Count whitespace-separated words without building a list of them."""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+def _scan_file(path: Path) -> Dict:
+    """Collect the structural facts the validators need in one streaming pass.
+
+    The file is read line by line as bytes, so memory stays bounded by the
+    longest line rather than the file size. Header, front-matter and
+    truncation checks match the raw bytes; lines are decoded only for word
+    counting. Returns word_count, has_h1, has_h2, has_front_matter, tail
+    (last 100 characters) and truncation_markers (the markers found, in
+    TRUNCATION_MARKERS order).
+    """
+    word_count = 0
+    has_h1 = False
+    has_h2 = False
+    has_front_matter = False
+    # Up to 4 bytes per UTF-8 character covers the last 100 characters.
+    tail = b""
+    found = set()
+
+    with open(path, "rb") as f:
+        for line_no, line in enumerate(f):
+            if line_no == 0:
+                has_front_matter = line.startswith(b"---")
+            word_count += _count_words(line.decode("utf-8"))
+            has_h1 = has_h1 or bool(_H1_RE.match(line))
+            has_h2 = has_h2 or bool(_H2_RE.match(line))
+            for match in _TRUNCATION_RE.finditer(line):
+                found.add(_TRUNCATION_BY_LOWER[match.group(0).lower()])
+            tail = (tail + line)[-400:]
+
+    return {
+        "word_count": word_count,
+        "has_h1": has_h1,
+        "has_h2": has_h2,
+        "has_front_matter": has_front_matter,
+        # A cut may split a character; drop the partial bytes.
+        "tail": tail.decode("utf-8", errors="ignore")[-100:],
+        "truncation_markers": [m for m in TRUNCATION_MARKERS if m in found],
+    }
+
+
+def _project_entries(base_name: str) -> Dict[str, os.DirEntry]:
+    """List the project directory once, keyed by file name.
+
+    Validators check membership in this dict instead of stat-ing each
+    candidate path; a missing project directory yields an empty dict.
+    """
+    try:
+        with os.scandir(config.PROJECTS_DIR / base_name) as it:
+            return {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        return {}
+
 
 class ValidationResult:
     """Stores validation results with pass/fail and details."""
@@ -43,44 +141,54 @@ class ValidationResult:
     def add_info(self, message: str):
         self.info.append(message)
 
-    def print_result(self):
-        """Print formatted validation result."""
+    def format_result(self) -> str:
+        """Return the formatted validation result as text."""
+        buf = io.StringIO()
         status = "✅ PASS" if self.passed else "❌ FAIL"
-        print(f"\n{status} - {self.name}")
+        print(f"\n{status} - {self.name}", file=buf)
 
         if self.info:
             for info in self.info:
-                print(f"  ℹ️  {info}")
+                print(f"  ℹ️  {info}", file=buf)
 
         if self.warnings:
             for warning in self.warnings:
-                print(f"  ⚠️  {warning}")
+                print(f"  ⚠️  {warning}", file=buf)
 
         if self.errors:
             for error in self.errors:
-                print(f"  ❌ {error}")
+                print(f"  ❌ {error}", file=buf)
+
+        return buf.getvalue()
+
+    def print_result(self):
+        """Print formatted validation result."""
+        sys.stdout.write(self.format_result())
 
 
-def validate_formatted_file(base_name: str) -> ValidationResult:
+def validate_formatted_file(
+    base_name: str, entries: Optional[Dict[str, os.DirEntry]] = None
+) -> ValidationResult:
     """Validate formatted transcript completeness."""
     result = ValidationResult("Formatted Transcript")
+    if entries is None:
+        entries = _project_entries(base_name)
 
     # Check for either formatted.md or formatted_yaml.md
-    formatted_file = (
-        config.PROJECTS_DIR / base_name / f"{base_name}{config.SUFFIX_FORMATTED}"
-    )
-    yaml_file = config.PROJECTS_DIR / base_name / f"{base_name}{config.SUFFIX_YAML}"
+    formatted_name = f"{base_name}{config.SUFFIX_FORMATTED}"
+    yaml_name = f"{base_name}{config.SUFFIX_YAML}"
 
-    file_to_check = yaml_file if yaml_file.exists() else formatted_file
+    name_to_check = yaml_name if yaml_name in entries else formatted_name
 
-    if not file_to_check.exists():
-        result.add_error(f"File not found: {file_to_check.name}")
+    if name_to_check not in entries:
+        result.add_error(f"File not found: {name_to_check}")
         return result
 
-    content = file_to_check.read_text(encoding="utf-8")
+    file_to_check = Path(entries[name_to_check].path)
+    scan = _scan_file(file_to_check)
 
     # Check minimum length (transcripts should be substantial)
-    word_count = len(content.split())
+    word_count = scan["word_count"]
     result.add_info(f"Word count: {word_count:,}")
 
     if word_count < config.TRANSCRIPT_MIN_WORDS:
@@ -91,29 +199,22 @@ def validate_formatted_file(base_name: str) -> ValidationResult:
         result.add_warning(f"Transcript shorter than typical ({word_count} words)")
 
     # Check for YAML front matter (if yaml file)
-    if file_to_check == yaml_file:
-        if not content.startswith("---"):
+    if name_to_check == yaml_name:
+        if not scan["has_front_matter"]:
             result.add_error("YAML file missing front matter")
         else:
             result.add_info("YAML front matter present")
 
     # Check for proper structure markers
-    if "## " not in content:
+    if not scan["has_h2"]:
         result.add_warning("No H2 headers found - may lack structure")
 
     # Check for truncation indicators
-    truncation_markers = [
-        "...[truncated]",
-        "[content cut off]",
-        "...(continued)",
-        "[OUTPUT LIMIT REACHED]",
-    ]
-    for marker in truncation_markers:
-        if marker.lower() in content.lower():
-            result.add_error(f"Found truncation marker: {marker}")
+    for marker in scan["truncation_markers"]:
+        result.add_error(f"Found truncation marker: {marker}")
 
     # Check file doesn't end abruptly (incomplete sentence)
-    last_100_chars = content[-100:].strip()
+    last_100_chars = scan["tail"].strip()
     if last_100_chars and not any(
         last_100_chars.endswith(p) for p in [".", "!", "?", '"', "'"]
     ):
@@ -122,10 +223,13 @@ def validate_formatted_file(base_name: str) -> ValidationResult:
     return result
 
 
-def validate_core_outputs(base_name: str) -> ValidationResult:
+def validate_core_outputs(
+    base_name: str, entries: Optional[Dict[str, os.DirEntry]] = None
+) -> ValidationResult:
     """Validate core one-artifact-per-output files exist and are non-empty."""
     result = ValidationResult("Core Outputs")
-    project_dir = config.PROJECTS_DIR / base_name
+    if entries is None:
+        entries = _project_entries(base_name)
 
     required_files = [
         ("Structural Themes", config.SUFFIX_STRUCTURAL_THEMES),
@@ -139,36 +243,39 @@ def validate_core_outputs(base_name: str) -> ValidationResult:
     ]
 
     for label, suffix in required_files:
-        file_path = project_dir / f"{base_name}{suffix}"
-        if not file_path.exists():
-            result.add_error(f"Missing file: {file_path.name}")
+        file_name = f"{base_name}{suffix}"
+        if file_name not in entries:
+            result.add_error(f"Missing file: {file_name}")
             continue
 
-        content = file_path.read_text(encoding="utf-8").strip()
+        content = Path(entries[file_name].path).read_text(encoding="utf-8").strip()
         if len(content) < 40:
-            result.add_error(f"File appears empty: {file_path.name}")
+            result.add_error(f"File appears empty: {file_name}")
         else:
-            result.add_info(f"Found {label}: {file_path.name}")
+            result.add_info(f"Found {label}: {file_name}")
 
     return result
 
 
-def validate_key_terms(base_name: str) -> ValidationResult:
+def validate_key_terms(
+    base_name: str, entries: Optional[Dict[str, os.DirEntry]] = None
+) -> ValidationResult:
     """Validate key terms file."""
     result = ValidationResult("Key Terms")
+    if entries is None:
+        entries = _project_entries(base_name)
 
-    file_path = (
-        config.PROJECTS_DIR / base_name / f"{base_name}{config.SUFFIX_KEY_TERMS}"
-    )
+    file_name = f"{base_name}{config.SUFFIX_KEY_TERMS}"
 
-    if not file_path.exists():
-        result.add_error(f"File not found: {file_path.name}")
+    if file_name not in entries:
+        result.add_error(f"File not found: {file_name}")
         return result
 
+    file_path = Path(entries[file_name].path)
     content = file_path.read_text(encoding="utf-8")
 
     # Should have at least a few terms
-    term_count = len(re.findall(r"^-\s+\*\*", content, re.MULTILINE))
+    term_count = len(_TERM_BULLET_RE.findall(content))
     result.add_info(f"Found {term_count} terms")
 
     if term_count == 0:
@@ -179,29 +286,31 @@ def validate_key_terms(base_name: str) -> ValidationResult:
     return result
 
 
-def validate_blog(base_name: str) -> ValidationResult:
+def validate_blog(
+    base_name: str, entries: Optional[Dict[str, os.DirEntry]] = None
+) -> ValidationResult:
     """Validate blog post completeness."""
     result = ValidationResult("Blog Post")
+    if entries is None:
+        entries = _project_entries(base_name)
 
-    file_path = config.PROJECTS_DIR / base_name / f"{base_name}{config.SUFFIX_BLOG}"
+    file_name = f"{base_name}{config.SUFFIX_BLOG}"
 
-    if not file_path.exists():
-        result.add_error(f"File not found: {file_path.name}")
+    if file_name not in entries:
+        result.add_error(f"File not found: {file_name}")
         return result
 
-    content = file_path.read_text(encoding="utf-8")
+    file_path = Path(entries[file_name].path)
+    scan = _scan_file(file_path)
 
     # Blog should have structure
-    has_title = bool(re.search(r"^#\s+", content, re.MULTILINE))
-    has_headers = bool(re.search(r"^##\s+", content, re.MULTILINE))
-
-    if not has_title:
+    if not scan["has_h1"]:
         result.add_warning("No H1 title found")
-    if not has_headers:
+    if not scan["has_h2"]:
         result.add_warning("No H2 headers found - may lack structure")
 
     # Check length (blog should be substantial)
-    word_count = len(content.split())
+    word_count = scan["word_count"]
     result.add_info(f"Word count: {word_count:,}")
 
     if word_count < config.BLOG_MIN_WORDS:
@@ -216,40 +325,52 @@ def validate_blog(base_name: str) -> ValidationResult:
 
 def validate_all(base_name: str) -> Dict[str, ValidationResult]:
     """Run all validation checks."""
-    results = {}
-
-    print("=" * 80)
-    print(f"COMPLETENESS VALIDATION: {base_name}")
-    print("=" * 80)
-
-    # Run all validators
-    results["formatted"] = validate_formatted_file(base_name)
-    results["core_outputs"] = validate_core_outputs(base_name)
-    results["terms"] = validate_key_terms(base_name)
-    results["blog"] = validate_blog(base_name)
-
-    # Print results
+    # The report is assembled in memory and written to stdout in one call.
+    buf = io.StringIO()
+    print("=" * 80, file=buf)
+    print(f"COMPLETENESS VALIDATION: {base_name}", file=buf)
+    print("=" * 80, file=buf)
+
+    # List the project directory once and share it across validators
+    entries = _project_entries(base_name)
+
+    # Run all validators; each reads different files, so their I/O overlaps
+    validators = [
+        ("formatted", validate_formatted_file),
+        ("core_outputs", validate_core_outputs),
+        ("terms", validate_key_terms),
+        ("blog", validate_blog),
+    ]
+    with ThreadPoolExecutor(max_workers=len(validators)) as executor:
+        futures = {
+            key: executor.submit(validator, base_name, entries)
+            for key, validator in validators
+        }
+        results = {key: future.result() for key, future in futures.items()}
+
+    # Print results in a fixed order once every validator has finished
     for result in results.values():
-        result.print_result()
+        buf.write(result.format_result())
 
     # Summary
-    print("\n" + "=" * 80)
+    print("\n" + "=" * 80, file=buf)
     passed = sum(1 for r in results.values() if r.passed)
     total = len(results)
 
     if passed == total:
-        print(f"✅ ALL CHECKS PASSED ({passed}/{total})")
+        print(f"✅ ALL CHECKS PASSED ({passed}/{total})", file=buf)
         return_code = 0
     else:
-        print(f"❌ VALIDATION FAILED ({passed}/{total} passed)")
+        print(f"❌ VALIDATION FAILED ({passed}/{total} passed)", file=buf)
         return_code = 1
 
-    print("=" * 80)
+    print("=" * 80, file=buf)
+    sys.stdout.write(buf.getvalue())
 
     return results, return_code
 
 
-def main():
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Validate transcript processing completeness."
     )
@@ -259,8 +380,15 @@ def main():
     parser.add_argument(
         "--strict", action="store_true", help="Treat warnings as errors"
     )
+    return parser
+
+
+# Built once at import so repeated main() calls reuse it.
+_PARSER = _build_parser()
+
 
-    args = parser.parse_args()
+def main(argv=None):
+    args = _PARSER.parse_args(argv)
 
     results, return_code = validate_all(args.base_name)
 
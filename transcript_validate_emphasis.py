@@ -5,79 +5,171 @@ Checks that quoted text actually exists in the source document.
 """
 
 import re
-from difflib import SequenceMatcher
 from pathlib import Path
 
+from rapidfuzz import fuzz
+
 import config
 from transcript_utils import load_emphasis_items
 
+_SPEAKER_TAG_RE = re.compile(
+    r"(\*\*[^*]+:\*\*\s*|<strong>[^<]+:</strong>\s*)", re.IGNORECASE
+)
+_SIC_NOTE_RE = re.compile(r"\[sic\]\s*\([^)]+\)")
+_SIC_RE = re.compile(r"\[sic\]")
+# Timestamps like [00:00:00] and punctuation both become a space; neither
+# can create or break the other, so they share one pass.
+_TIMESTAMP_OR_PUNCT_RE = re.compile(r"\[\d{2}:\d{2}:\d{2}\]|[.,!?;:—\-\'\"()]")
+_WS_RE = re.compile(r"\s+")
+_WORD_RE = re.compile(r"\S+")
+
+# Exact-prefix lengths (in words) tried before fuzzy matching, longest first.
+_PREFIX_WORD_COUNTS = (25, 15, 8)
+
+# Characters searched before and after the previous match when quotes are
+# validated in transcript order.
+_HINT_LOOKBACK = 512
+_HINT_LOOKAHEAD = 512
+
 
 def normalize_text(text):
     """Normalize text for comparison by removing tags and punctuation."""
     # Remove speaker tags that can interrupt quotes
-    text = re.sub(
-        r"(\*\*[^*]+:\*\*\s*|<strong>[^<]+:</strong>\s*)", "", text, flags=re.IGNORECASE
-    )
+    text = _SPEAKER_TAG_RE.sub("", text)
 
     # Remove [sic] and its variations
-    text = re.sub(r"\[sic\]\s*\([^)]+\)", "", text)
-    text = re.sub(r"\[sic\]", "", text)
+    text = _SIC_NOTE_RE.sub("", text)
+    text = _SIC_RE.sub("", text)
 
-    # Remove timestamps like [00:00:00]
-    text = re.sub(r"\[\d{2}:\d{2}:\d{2}\]", " ", text)
+    # Replace timestamps and punctuation with spaces for better fuzzy matching
+    text = _TIMESTAMP_OR_PUNCT_RE.sub(" ", text)
 
-    text = text.strip().lower()
+    # Collapse multiple spaces after removals; case-fold last, on the
+    # reduced text
+    return _WS_RE.sub(" ", text).strip().lower()
 
-    # Remove punctuation for better fuzzy matching
-    text = re.sub(r"[.,!?;:—\-\'\"()]", " ", text)
 
-    # Collapse multiple spaces after removals
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+def build_trigram_index(haystack_normalized):
+    """Map every run of three consecutive words to the offsets where it starts."""
+    spans = [m.span() for m in _WORD_RE.finditer(haystack_normalized)]
+    index = {}
+    for i in range(len(spans) - 2):
+        key = haystack_normalized[spans[i][0] : spans[i + 2][1]]
+        index.setdefault(key, []).append(spans[i][0])
+    return index
+
+
+def _best_region_match(needle_normalized, haystack_normalized, starts):
+    """Score the regions beginning at each start offset; return (score, text, end)."""
+    # Leave slack for words inserted or expanded in the transcript.
+    region_len = len(needle_normalized) + len(needle_normalized) // 4
+    best_score = 0
+    best_match = None
+    best_end = None
+    for start in starts:
+        region = haystack_normalized[start : start + region_len]
+        alignment = fuzz.partial_ratio_alignment(needle_normalized, region)
+        if alignment.score > best_score:
+            best_score = alignment.score
+            best_match = region[alignment.dest_start : alignment.dest_end]
+            best_end = start + alignment.dest_end
+            # Near-perfect already; later regions cannot change the verdict.
+            if best_score / 100 >= config.FUZZY_MATCH_EARLY_STOP:
+                break
+    return (best_score / 100, best_match, best_end)
+
 
+def find_best_match(
+    needle, haystack_normalized, threshold=0.85, trigram_index=None, hint=None
+):
+    """Find the best matching substring for needle in an already-normalized haystack.
 
-def find_best_match(needle, haystack, threshold=0.85):
-    """Find the best matching substring in haystack for needle."""
+    The haystack must come from normalize_text; callers validating many quotes
+    against one transcript normalize it once and pass it to every call. Exact
+    prefixes of the needle are located with str.find before any fuzzy work.
+    With a trigram_index from build_trigram_index, regions starting with the
+    needle's first three words are scored. A hint (offset in the haystack,
+    usually where the previous quote ended) scores the text around it. Any of
+    these skips the full scan only with a near-perfect match.
+
+    Returns (ratio, match, end), where end is the offset in the haystack just
+    past the match; match and end are None below the threshold.
+    """
     needle_normalized = normalize_text(needle)
-    haystack_normalized = normalize_text(haystack)
 
     pos = haystack_normalized.find(needle_normalized)
     if pos != -1:
-        return (1.0, needle)
-
-    needle_words = needle_normalized.split()
-    haystack_words = haystack_normalized.split()
-    needle_len = len(needle_words)
+        return (1.0, needle, pos + len(needle_normalized))
 
-    if needle_len > len(haystack_words):
-        return (0, None)
+    if len(needle_normalized) > len(haystack_normalized):
+        return (0, None, None)
 
+    # Each step below can only settle the verdict early with a near-perfect
+    # score; anything lower is kept as a candidate and the full scan decides.
     best_ratio = 0
     best_match = None
+    best_end = None
 
-    for i in range(len(haystack_words) - needle_len + 1):
-        window = " ".join(haystack_words[i : i + needle_len])
-        ratio = SequenceMatcher(None, needle_normalized, window).ratio()
-
+    # Quotes usually drift only near the end, so a long exact prefix pins
+    # down the region to score.
+    needle_words = needle_normalized.split()
+    prefix_starts = {
+        haystack_normalized.find(" ".join(needle_words[:word_count]))
+        for word_count in _PREFIX_WORD_COUNTS
+        if word_count < len(needle_words)
+    }
+    prefix_starts.discard(-1)
+    if prefix_starts:
+        ratio, match, end = _best_region_match(
+            needle_normalized, haystack_normalized, sorted(prefix_starts)
+        )
+        if ratio >= config.FUZZY_MATCH_EARLY_STOP:
+            return (ratio, match, end)
+        best_ratio, best_match, best_end = ratio, match, end
+
+    if trigram_index is not None:
+        key = " ".join(needle_words[:3])
+        ratio, match, end = _best_region_match(
+            needle_normalized, haystack_normalized, trigram_index.get(key, ())
+        )
+        if ratio >= config.FUZZY_MATCH_EARLY_STOP:
+            return (ratio, match, end)
         if ratio > best_ratio:
-            best_ratio = ratio
-            best_match = window
+            best_ratio, best_match, best_end = ratio, match, end
+
+    if hint is not None:
+        local_start = max(0, hint - _HINT_LOOKBACK)
+        local = haystack_normalized[
+            local_start : hint + 2 * len(needle_normalized) + _HINT_LOOKAHEAD
+        ]
+        alignment = fuzz.partial_ratio_alignment(needle_normalized, local)
+        ratio = alignment.score / 100
+        match = local[alignment.dest_start : alignment.dest_end]
+        end = local_start + alignment.dest_end
+        if ratio >= config.FUZZY_MATCH_EARLY_STOP:
+            return (ratio, match, end)
+        if ratio > best_ratio:
+            best_ratio, best_match, best_end = ratio, match, end
 
-            if ratio >= 0.98:
-                break
+    # partial_ratio slides the needle across the haystack inside rapidfuzz
+    # (bit-parallel Indel scoring), replacing the per-window Python loop.
+    alignment = fuzz.partial_ratio_alignment(needle_normalized, haystack_normalized)
+    if alignment.score / 100 > best_ratio:
+        best_ratio = alignment.score / 100
+        best_match = haystack_normalized[alignment.dest_start : alignment.dest_end]
+        best_end = alignment.dest_end
 
     if best_ratio >= threshold:
-        return (best_ratio, best_match)
+        return (best_ratio, best_match, best_end)
 
-    return (best_ratio, None)
+    return (best_ratio, None, None)
 
 
 def validate_emphasis_items(base_name: str, formatted_file: Path):
     """Validate all emphasis quotes exist in the formatted transcript."""
 
     # Read formatted transcript
-    with open(formatted_file, "r", encoding="utf-8") as f:
-        formatted_content = f.read()
+    formatted_content = Path(formatted_file).read_text(encoding="utf-8")
 
     # Extract quotes using the centralized loader
     quotes = load_emphasis_items(base_name)
@@ -93,11 +185,45 @@ def validate_emphasis_items(base_name: str, formatted_file: Path):
     invalid_count = 0
     partial_count = 0
 
+    # Quotes are resolved by the cheapest tier that finds them: a plain
+    # substring search, then a search of the whitespace-collapsed text, and
+    # only then fuzzy matching. Each derived form of the transcript is built
+    # once, the first time a quote needs it.
+    formatted_collapsed = None
+    formatted_normalized = None
+    trigram_index = None
+    # Quotes tend to follow transcript order, so each fuzzy search looks near
+    # where the previous match ended first.
+    cursor = None
+
     for i, (label, quote) in enumerate(quotes, 1):
         # Try to find a substantial portion of the quote (first 50+ chars for matching)
         # Use smaller snippet to avoid issues with context boundaries
         quote_core = " ".join(quote.split()[:15])  # First 15 words
-        ratio, match = find_best_match(quote_core, formatted_content, threshold=0.80)
+        if quote_core in formatted_content:
+            ratio, match = 1.0, quote_core
+        else:
+            if formatted_collapsed is None:
+                # quote_core is already single-spaced, so a quote broken
+                # across lines still matches the collapsed text exactly.
+                formatted_collapsed = _WS_RE.sub(" ", formatted_content)
+            if quote_core in formatted_collapsed:
+                ratio, match = 1.0, quote_core
+            else:
+                if formatted_normalized is None:
+                    # normalize_text collapses whitespace itself, so the
+                    # collapsed text normalizes to the same result.
+                    formatted_normalized = normalize_text(formatted_collapsed)
+                    trigram_index = build_trigram_index(formatted_normalized)
+                ratio, match, end = find_best_match(
+                    quote_core,
+                    formatted_normalized,
+                    threshold=0.80,
+                    trigram_index=trigram_index,
+                    hint=cursor,
+                )
+                if match:
+                    cursor = end
 
         print(f"\n{i}. {label}")
         print(f"   Quote preview: {quote[:80]}...")
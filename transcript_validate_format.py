@@ -12,10 +12,7 @@ import sys
 from pipeline import validate_format
 
 
-def main():
-    """
-    Main function to handle command-line execution of the format validation process.
-    """
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Validate the format of a transcript using the core pipeline."
     )
@@ -33,8 +30,18 @@ def main():
         help="Optional file with one skip word per line",
         default=None,
     )
+    return parser
+
+
+# Built once at import so repeated main() calls reuse it.
+_PARSER = _build_parser()
 
-    args = parser.parse_args()
+
+def main(argv=None):
+    """
+    Main function to handle command-line execution of the format validation process.
+    """
+    args = _PARSER.parse_args(argv)
 
     print(f"Starting format validation for: {args.raw_filename}")
 
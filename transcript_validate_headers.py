@@ -1,9 +1,12 @@
 import argparse
+import io
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import anthropic
 
@@ -29,6 +32,37 @@ except ImportError:
 
 # Configuration
 BATCH_SIZE = 5
+# Batches sent to the API at once, after the first batch has primed the cache
+MAX_PARALLEL_BATCHES = 4
+
+# An H2 heading line; same matches as r"^##\s+(.+)$" with re.MULTILINE, but
+# the literal "##" comes first so the regex engine can jump between
+# candidates, and the lookbehind then checks "##" starts its line.
+_H2_HEADING_RE = re.compile(r"##(?<![^\n]##)\s+(.+)$", re.MULTILINE)
+
+
+def _file_key(path: Path) -> tuple:
+    """Cache key that changes whenever the file is rewritten."""
+    st = path.stat()
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=8)
+def _read_problematic_terms(key: tuple) -> tuple:
+    """Parse a problematic-terms file; cached per (path, mtime, size)."""
+    content = Path(key[0]).read_text(encoding="utf-8")
+    # Extract lines that aren't comments or empty
+    return tuple(
+        line.strip().lower()
+        for line in content.splitlines()
+        if line.strip() and not line.strip().startswith("#")
+    )
+
+
+@lru_cache(maxsize=8)
+def _read_prompt(key: tuple) -> str:
+    """Read a prompt template; cached per (path, mtime, size)."""
+    return Path(key[0]).read_text(encoding="utf-8")
 
 
 class HeaderValidator:
@@ -64,13 +98,8 @@ class HeaderValidator:
             self._create_default_terms_file()
 
         try:
-            content = self.terms_file.read_text(encoding="utf-8")
-            # Extract lines that aren't comments or empty
-            terms = [
-                line.strip().lower()
-                for line in content.splitlines()
-                if line.strip() and not line.strip().startswith("#")
-            ]
+            # Re-read only when the file has changed since the last validator
+            terms = list(_read_problematic_terms(_file_key(self.terms_file)))
             self.logger.info(f"Loaded {len(terms)} problematic terms.")
             return terms
         except Exception as e:
@@ -97,7 +126,7 @@ class HeaderValidator:
             raise FileNotFoundError(
                 f"Validation prompt not found at {self.prompt_file}"
             )
-        content = self.prompt_file.read_text(encoding="utf-8")
+        content = _read_prompt(_file_key(self.prompt_file))
         if "{batch_content}" not in content:
             self.logger.warning(
                 f"⚠️ Prompt template '{self.prompt_file.name}' is missing '{{batch_content}}' placeholder. Validation will likely fail."
@@ -114,7 +143,7 @@ class HeaderValidator:
         sections = []
 
         # Find all H2 headers and their positions
-        matches = list(re.finditer(r"^##\s+(.+)$", content, re.MULTILINE))
+        matches = list(_H2_HEADING_RE.finditer(content))
 
         for i, match in enumerate(matches):
             heading = match.group(1).strip()
@@ -157,14 +186,17 @@ class HeaderValidator:
         """Send a batch of sections to Claude for validation."""
 
         # Construct batch content string
-        batch_content = ""
+        parts = []
         for section in batch:
             display_content = section["content"]
 
-            batch_content += f"\nSECTION {section['number']}:\n"
-            batch_content += f"Heading: {section['heading']}\n"
-            batch_content += f"Content: {display_content}\n"
-            batch_content += "-" * 40 + "\n"
+            parts.append(
+                f"\nSECTION {section['number']}:\n"
+                f"Heading: {section['heading']}\n"
+                f"Content: {display_content}\n"
+                + "-" * 40 + "\n"
+            )
+        batch_content = "".join(parts)
 
         # Log size info
         template_len = len(self.cached_system_message[0]["text"])
@@ -205,38 +237,46 @@ class HeaderValidator:
         failed_batches = []
 
         # Process in batches
-        total_batches = (len(sections) + BATCH_SIZE - 1) // BATCH_SIZE
+        batches = [
+            sections[i: i + BATCH_SIZE] for i in range(0, len(sections), BATCH_SIZE)
+        ]
+        total_batches = len(batches)
 
         self.logger.info(
             f"Starting validation of {len(sections)} sections in {total_batches} batches..."
         )
 
-        for i in range(0, len(sections), BATCH_SIZE):
-            batch = sections[i: i + BATCH_SIZE]
-            batch_num = (i // BATCH_SIZE) + 1
-
-            self.logger.info(
-                f"Processing Batch {batch_num}/{total_batches} (Sections {batch[0]['number']}-{batch[-1]['number']})"
-            )
-
-            # 1. Local Check for Problematic Terms
-            for section in batch:
-                bad_terms = self.check_problematic_terms(section["heading"])
-                if bad_terms:
-                    self.logger.warning(
-                        f"Section {section['number']} heading contains problematic terms: {bad_terms}"
+        # 1. Local Check for Problematic Terms
+        for section in sections:
+            bad_terms = self.check_problematic_terms(section["heading"])
+            if bad_terms:
+                self.logger.warning(
+                    f"Section {section['number']} heading contains problematic terms: {bad_terms}"
+                )
+                section["local_flag"] = bad_terms
+
+        # 2. AI Validation. The first batch goes alone so that it writes the
+        # cached system prompt; the rest are network-bound and run
+        # concurrently, reading that cache.
+        responses = [self._process_batch(batches[0], 1, total_batches, model)]
+        if total_batches > 1:
+            workers = min(MAX_PARALLEL_BATCHES, total_batches - 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        self._process_batch, batch, batch_num, total_batches, model
                     )
-                    section["local_flag"] = bad_terms
+                    for batch_num, batch in enumerate(batches[1:], 2)
+                ]
+                responses.extend(future.result() for future in futures)
 
-            # 2. AI Validation
-            try:
-                ai_response = self.validate_batch(batch, model=model)
+        for batch_num, (batch, ai_response) in enumerate(zip(batches, responses), 1):
+            if ai_response is None:
+                failed_batches.append(batch_num)
+            else:
                 results.append(
                     {"batch": batch_num, "sections": batch, "response": ai_response}
                 )
-            except Exception as e:
-                self.logger.error(f"Failed to validate batch {batch_num}: {e}")
-                failed_batches.append(batch_num)
 
         self._save_report(input_path, results, failed_batches)
         if failed_batches:
@@ -247,6 +287,19 @@ class HeaderValidator:
             return False
         return True
 
+    def _process_batch(
+        self, batch: List[Dict], batch_num: int, total_batches: int, model: str
+    ) -> Optional[str]:
+        """Validate one batch; returns the AI response, or None if the call failed."""
+        self.logger.info(
+            f"Processing Batch {batch_num}/{total_batches} (Sections {batch[0]['number']}-{batch[-1]['number']})"
+        )
+        try:
+            return self.validate_batch(batch, model=model)
+        except Exception as e:
+            self.logger.error(f"Failed to validate batch {batch_num}: {e}")
+            return None
+
     def _save_report(self, input_path: Path, results: List[Dict], failed_batches: List[int]):
         """Save validation report to file."""
         base_name = input_path.stem.replace(
@@ -256,37 +309,40 @@ class HeaderValidator:
         report_path = project_dir / \
             f"{base_name}{config.SUFFIX_HEADER_VAL_REPORT}"
 
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write("# Header Validation Report\n")
-            f.write(f"Source: {input_path.name}\n")
-            f.write(f"Date: {os.path.getmtime(input_path)}\n\n")
-
-            f.write("## Problematic Term Flags (Local Check)\n")
-            has_flags = False
-            for batch_result in results:
-                for section in batch_result["sections"]:
-                    if section.get("local_flag"):
-                        has_flags = True
-                        f.write(
-                            f"- **Section {section['number']}**: '{section['heading']}' contains {section['local_flag']}\n"
-                        )
-
-            if not has_flags:
-                f.write("None found.\n")
-
-            f.write("\n## AI Validation Details\n")
-            for batch_result in results:
-                f.write(f"\n### Batch {batch_result['batch']}\n")
-                f.write(batch_result["response"])
-                f.write("\n" + "=" * 50 + "\n")
-
-            if failed_batches:
-                f.write("\n## Failed Batches\n")
-                f.write(
-                    "The following batches failed API validation and were not evaluated: "
-                )
-                f.write(", ".join(str(b) for b in failed_batches))
-                f.write("\n")
+        # Build the whole report in memory and write it in one call
+        buf = io.StringIO()
+        buf.write("# Header Validation Report\n")
+        buf.write(f"Source: {input_path.name}\n")
+        buf.write(f"Date: {os.path.getmtime(input_path)}\n\n")
+
+        buf.write("## Problematic Term Flags (Local Check)\n")
+        has_flags = False
+        for batch_result in results:
+            for section in batch_result["sections"]:
+                if section.get("local_flag"):
+                    has_flags = True
+                    buf.write(
+                        f"- **Section {section['number']}**: '{section['heading']}' contains {section['local_flag']}\n"
+                    )
+
+        if not has_flags:
+            buf.write("None found.\n")
+
+        buf.write("\n## AI Validation Details\n")
+        for batch_result in results:
+            buf.write(f"\n### Batch {batch_result['batch']}\n")
+            buf.write(batch_result["response"])
+            buf.write("\n" + "=" * 50 + "\n")
+
+        if failed_batches:
+            buf.write("\n## Failed Batches\n")
+            buf.write(
+                "The following batches failed API validation and were not evaluated: "
+            )
+            buf.write(", ".join(str(b) for b in failed_batches))
+            buf.write("\n")
+
+        report_path.write_text(buf.getvalue(), encoding="utf-8")
 
         self.logger.info(
             f"Validation complete. Report saved to: {report_path}")
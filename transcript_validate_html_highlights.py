@@ -5,10 +5,10 @@ This ensures that the highlighting logic in the HTML generator worked correctly.
 """
 
 import sys
-from difflib import SequenceMatcher
 
 import config
 from transcript_utils import (
+    find_best_matches_in_html,
     load_bowen_references,
     load_emphasis_items,
     normalize_text,
@@ -16,42 +16,6 @@ from transcript_utils import (
 )
 
 
-def find_best_match_in_html(needle, haystack_normalized, threshold=0.85):
-    """
-    Find the best matching substring in normalized HTML content.
-    Returns (ratio, match_text).
-    """
-    needle_normalized = normalize_text(needle, aggressive=True)
-
-    if needle_normalized in haystack_normalized:
-        return (1.0, needle)
-
-    # Fuzzy match
-    needle_words = needle_normalized.split()
-    haystack_words = haystack_normalized.split()
-    needle_len = len(needle_words)
-
-    if needle_len > len(haystack_words):
-        return (0.0, None)
-
-    best_ratio = 0
-    best_match = None
-
-    # Optimization: Check window only if first word matches (optional, but speeds up large files)
-    # For now, we use standard sliding window
-    for i in range(len(haystack_words) - needle_len + 1):
-        window = ' '.join(haystack_words[i:i + needle_len])
-        ratio = SequenceMatcher(None, needle_normalized, window).ratio()
-
-        if ratio > best_ratio:
-            best_ratio = ratio
-            best_match = window
-            if ratio > 0.98:  # Early exit
-                break
-
-    return (best_ratio, best_match)
-
-
 def validate_html_highlights(base_name: str, logger=None):
     if logger is None:
         logger = setup_logging('validate_html_highlights')
@@ -85,12 +49,12 @@ def validate_html_highlights(base_name: str, logger=None):
     found_count = 0
     missing_count = 0
 
-    for type_, label, quote in all_items:
-        # We use a slightly lower threshold for HTML because of potential
-        # spacing/tag artifacts that normalization might miss
-        ratio, _ = find_best_match_in_html(
-            quote, html_normalized, threshold=0.80)
+    # We use a slightly lower threshold for HTML because of potential
+    # spacing/tag artifacts that normalization might miss
+    matches = find_best_matches_in_html(
+        [quote for _, _, quote in all_items], html_normalized, threshold=0.80)
 
+    for (type_, label, quote), (ratio, _) in zip(all_items, matches):
         if ratio >= 0.85:
             found_count += 1
             # logger.info(f"  ✓ Found {type_}: {label}")
@@ -5,7 +5,7 @@ Checks that all expected content from canonical artifact files appears in the we
 Supports both sidebar layout and simple single-column layout.
 
 Usage:
-    python transcript_validate_webpage.py "Title - Presenter - Date" [--simple]
+    python transcript_validate_webpage.py "Title - Presenter - Date" ["Title - Presenter - Date" ...] [--simple]
 
 Example:
     python transcript_validate_webpage.py "This is a test - Dave Galloway - 2025-12-07"
@@ -13,13 +13,19 @@ Example:
 """
 
 import argparse
+import math
 import re
 import sys
 from difflib import SequenceMatcher
 from pathlib import Path
 
 import config
-from transcript_utils import load_bowen_references, load_emphasis_items, normalize_text
+from transcript_utils import (
+    find_best_matches_in_html,
+    load_bowen_references,
+    load_emphasis_items,
+    normalize_text,
+)
 
 try:
     from bs4 import BeautifulSoup
@@ -27,26 +33,56 @@ except ImportError:
     print("❌ Error: beautifulsoup4 is not installed. Run: pip install beautifulsoup4")
     sys.exit(1)
 
+# Punctuation dropped by normalize_for_comparison.
+_COMPARE_PUNCT_TABLE = str.maketrans("", "", ",;:.!?")
+
+# Patterns used by the section counters and metadata extractors, compiled once at import.
+_H3_LINE_RE = re.compile(r"^### (.+)$", re.MULTILINE)
+_TOPICS_SECTION_RE = re.compile(
+    r"## (?:\*\*)?(?:Key )?Topics(?:\*\*)?(.*?)(?=^## |\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+_THEMES_SECTION_RE = re.compile(
+    r"## (?:\*\*)?(?:Structural Themes|Interpretive Themes|Themes|Interpretive / Process Themes)(?:\*\*)?(.*?)(?=^## |\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+_KEY_TERMS_SECTION_RE = re.compile(
+    r"## (?:\*\*)?Key Terms(?:\*\*)?(.*?)(?=^## |^---+|\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+_NUMBERED_BOLD_THEME_RE = re.compile(r"^\d+\.\s+\*\*([^*]+)\*\*", re.MULTILINE)
+_NUMBERED_ITEM_RE = re.compile(r"\d+\.")
+
+
+def _strip_front_matter(content):
+    """Strip YAML front matter: everything up to and including the second "---\\n"."""
+    if content.startswith("---"):
+        start = content.find("---\n")
+        if start != -1:
+            end = content.find("---\n", start + 4)
+            if end != -1:
+                return content[end + 4:]
+    return content
+
 
 def count_sections_in_formatted(formatted_file):
     """Count sections in formatted markdown file."""
-    with open(formatted_file, "r", encoding="utf-8") as f:
-        content = f.read()
+    content = Path(formatted_file).read_text(encoding="utf-8")
 
     # Strip YAML front matter
-    if content.startswith("---"):
-        parts = content.split("---\n", 2)
-        if len(parts) >= 3:
-            content = parts[2]
+    content = _strip_front_matter(content)
 
-    # Count h2 sections (## Section Name)
-    sections = re.findall(r"^## (.+)$", content, re.MULTILINE)
+    # Count h2 sections (## Section Name); startswith("## ") already rejects "###"
+    sections = [
+        line[3:]
+        for line in content.split("\n")
+        if line.startswith("## ") and len(line) > 3
+    ]
     return len(sections), sections
 
 
-def count_sections_in_html(html_file):
-    """Count sections in HTML file (works for both sidebar and simple layouts)."""
-    soup = BeautifulSoup(html_file.read_text(encoding="utf-8"), "html.parser")
+def count_sections_in_html(soup):
+    """Count sections in parsed HTML (works for both sidebar and simple layouts)."""
 
     # Try sidebar layout first
     main_content = soup.find("main", class_="main-content")
@@ -69,13 +105,9 @@ def count_sections_in_html(html_file):
 
 def normalize_for_comparison(text):
     """Normalize text for comparison - removes extra whitespace and punctuation."""
-    # Convert to lowercase
-    text = text.lower()
-    # Remove extra whitespace
-    text = re.sub(r"\s+", " ", text)
-    # Remove common punctuation that might differ
-    text = re.sub(r"[,;:\.\!\?]", "", text)
-    return text.strip()
+    # Lowercase and collapse whitespace, then drop common punctuation that might differ
+    text = " ".join(text.lower().split())
+    return text.translate(_COMPARE_PUNCT_TABLE).strip()
 
 
 def split_multi_labels(labels):
@@ -87,14 +119,11 @@ def split_multi_labels(labels):
     return expanded
 
 
-def find_missing_emphasis_items(base_name, html_file):
-    """Identify which specific emphasis items are missing from HTML."""
-    # Use the centralized loader from transcript_utils
-    emphasis_items = load_emphasis_items(base_name)
+def find_missing_emphasis_items(emphasis_items, soup):
+    """Identify which specific emphasis items are missing from parsed HTML."""
     source_labels = [label for label, _ in emphasis_items]
 
     # Extract emphasis labels that are highlighted in HTML
-    soup = BeautifulSoup(html_file.read_text(encoding="utf-8"), "html.parser")
     highlighted_labels = []
     for mark in soup.find_all("mark", class_="emphasis"):
         title = mark.get("title", "")
@@ -103,21 +132,14 @@ def find_missing_emphasis_items(base_name, html_file):
             highlighted_labels.append(label)
 
     # Find missing items
-    missing = []
-    for label in source_labels:
-        if label not in highlighted_labels:
-            missing.append(label)
+    highlighted = frozenset(highlighted_labels)
+    return [label for label in source_labels if label not in highlighted]
 
-    return missing
 
-
-def find_missing_bowen_items(base_name, html_file):
-    """Identify which specific Bowen references are missing from HTML."""
-    # Use the centralized loader from transcript_utils
-    bowen_refs = load_bowen_references(base_name)
+def find_missing_bowen_items(bowen_refs, soup):
+    """Identify which specific Bowen references are missing from parsed HTML."""
     source_labels = [label for label, _ in bowen_refs]
 
-    soup = BeautifulSoup(html_file.read_text(encoding="utf-8"), "html.parser")
     highlighted_labels = []
     for mark in soup.find_all("mark", class_="bowen-ref"):
         title = mark.get("title", "")
@@ -125,14 +147,8 @@ def find_missing_bowen_items(base_name, html_file):
             label = title.split("Bowen Reference:", 1)[1].strip()
             highlighted_labels.append(label)
 
-    highlighted_labels = split_multi_labels(highlighted_labels)
-
-    missing = []
-    for label in source_labels:
-        if label not in highlighted_labels:
-            missing.append(label)
-
-    return missing
+    highlighted = frozenset(split_multi_labels(highlighted_labels))
+    return [label for label in source_labels if label not in highlighted]
 
 
 def extract_topics_themes_metadata(base_name: str):
@@ -148,12 +164,7 @@ def extract_topics_themes_metadata(base_name: str):
     def _read(path: Path) -> str:
         if not path.exists():
             return ""
-        content = path.read_text(encoding="utf-8")
-        if content.startswith("---"):
-            parts = content.split("---\n", 2)
-            if len(parts) >= 3:
-                content = parts[2]
-        return content
+        return _strip_front_matter(path.read_text(encoding="utf-8"))
 
     topics_content = _read(topics_file)
     structural_content = _read(structural_file)
@@ -189,46 +200,34 @@ def extract_topics_themes_metadata(base_name: str):
         metadata["summary_length"] = len(summary_content.strip())
 
     # Count Topics
-    topics_match = re.search(
-        r"## (?:\*\*)?(?:Key )?Topics(?:\*\*)?(.*?)(?=^## |\Z)",
-        topics_content,
-        re.MULTILINE | re.DOTALL,
-    )
+    topics_match = _TOPICS_SECTION_RE.search(topics_content)
     if topics_match:
         topics_text = topics_match.group(1).strip()
         # Extract topic names (### Topic Name)
-        topics = re.findall(r"^### (.+)$", topics_text, re.MULTILINE)
+        topics = _H3_LINE_RE.findall(topics_text)
         metadata["topics_list"] = [t.strip() for t in topics]
         metadata["topics_count"] = len(topics)
 
     # Count Structural + Interpretive Themes
-    theme_sections = re.finditer(
-        r"## (?:\*\*)?(?:Structural Themes|Interpretive Themes|Themes|Interpretive / Process Themes)(?:\*\*)?(.*?)(?=^## |\Z)",
-        "\n".join([structural_content, interpretive_content]),
-        re.MULTILINE | re.DOTALL,
+    theme_sections = _THEMES_SECTION_RE.finditer(
+        "\n".join([structural_content, interpretive_content])
     )
     collected_themes = []
     for m in theme_sections:
         themes_text = m.group(1).strip()
-        themes_h3 = re.findall(r"^### (.+)$", themes_text, re.MULTILINE)
-        themes_numbered = re.findall(
-            r"^\d+\.\s+\*\*([^*]+)\*\*", themes_text, re.MULTILINE
-        )
+        themes_h3 = _H3_LINE_RE.findall(themes_text)
+        themes_numbered = _NUMBERED_BOLD_THEME_RE.findall(themes_text)
         collected_themes.extend(themes_h3 + themes_numbered)
     if collected_themes:
         metadata["themes_list"] = [t.strip() for t in collected_themes]
         metadata["themes_count"] = len(collected_themes)
 
     # Count Key Terms
-    key_terms_match = re.search(
-        r"## (?:\*\*)?Key Terms(?:\*\*)?(.*?)(?=^## |^---+|\Z)",
-        key_terms_content,
-        re.MULTILINE | re.DOTALL,
-    )
+    key_terms_match = _KEY_TERMS_SECTION_RE.search(key_terms_content)
     if key_terms_match:
         kt_text = key_terms_match.group(1)
         # Extract term names (### Term Name)
-        term_headings = re.findall(r"^### (.+)$", kt_text, re.MULTILINE)
+        term_headings = _H3_LINE_RE.findall(kt_text)
         metadata["key_terms_list"] = [t.strip() for t in term_headings]
         metadata["key_terms_count"] = len(term_headings)
 
@@ -237,9 +236,33 @@ def extract_topics_themes_metadata(base_name: str):
     return metadata
 
 
-def extract_html_metadata(html_file):
-    """Extract metadata from HTML sidebar."""
-    soup = BeautifulSoup(html_file.read_text(encoding="utf-8"), "html.parser")
+def _collect_highlights(container, metadata):
+    """Count Bowen/emphasis <mark> highlights under container and collect their labels in one pass."""
+    bowen_labels = []
+    emphasis_labels = []
+    bowen_count = emphasis_count = 0
+    for mark in container.find_all("mark", class_=["bowen-ref", "emphasis"]):
+        classes = mark.get("class", [])
+        title = mark.get("title", "")
+        if "bowen-ref" in classes:
+            bowen_count += 1
+            if "Bowen Reference:" in title:
+                bowen_labels.append(title.split("Bowen Reference:", 1)[1].strip())
+        if "emphasis" in classes:
+            emphasis_count += 1
+            if "Emphasized:" in title:
+                emphasis_labels.append(
+                    title.split("Emphasized:", 1)[1].split("|")[0].strip()
+                )
+
+    metadata["bowen_highlights"] = bowen_count
+    metadata["bowen_labels"] = split_multi_labels(bowen_labels)
+    metadata["emphasis_highlights"] = emphasis_count
+    metadata["emphasis_labels"] = emphasis_labels
+
+
+def extract_html_metadata(soup):
+    """Extract metadata from the parsed HTML sidebar."""
 
     metadata = {
         "has_abstract": False,
@@ -312,7 +335,7 @@ def extract_html_metadata(html_file):
             )
             # Also check numbered items
             for p in elem.find_all("p"):
-                if re.match(r"\d+\.", p.get_text()):
+                if _NUMBERED_ITEM_RE.match(p.get_text()):
                     strong = p.find("strong")
                     if strong:
                         metadata["themes_list"].append(strong.get_text(strip=True))
@@ -335,47 +358,20 @@ def extract_html_metadata(html_file):
                     t.strip() for t in text.split(",") if t.strip()
                 ]
 
-    # Count Bowen reference highlights in main content (exclude legend)
+    # Count Bowen reference and emphasis highlights in main content (exclude legend)
     main_content = soup.find("div", class_="transcript") or soup.find(
         "div", class_="content"
     )
     if not main_content:
         main_content = soup
 
-    bowen_marks = main_content.find_all("mark", class_="bowen-ref")
-    metadata["bowen_highlights"] = len(bowen_marks)
-
-    metadata["bowen_labels"] = []
-    for mark in bowen_marks:
-        title = mark.get("title", "")
-        if "Bowen Reference:" in title:
-            label = title.split("Bowen Reference:", 1)[1].strip()
-            metadata["bowen_labels"].append(label)
-
-    metadata["bowen_labels"] = [label.strip() for label in metadata["bowen_labels"]]
-    metadata["bowen_labels"] = split_multi_labels(metadata["bowen_labels"])
-
-    # Count emphasis highlights in main content (exclude legend) - use title attribute for accurate count
-    emphasis_marks = main_content.find_all("mark", class_="emphasis")
-    metadata["emphasis_highlights"] = len(emphasis_marks)
-
-    metadata["emphasis_labels"] = []
-    for mark in emphasis_marks:
-        title = mark.get("title", "")
-        if "Emphasized:" in title:
-            label = title.split("Emphasized:", 1)[1].split("|")[0].strip()
-            metadata["emphasis_labels"].append(label)
-
-    metadata["emphasis_labels"] = [
-        label.strip() for label in metadata["emphasis_labels"]
-    ]
+    _collect_highlights(main_content, metadata)
 
     return metadata
 
 
-def extract_html_simple_metadata(html_file):
-    """Extract metadata from simple HTML (single column, no sidebar)."""
-    soup = BeautifulSoup(html_file.read_text(encoding="utf-8"), "html.parser")
+def extract_html_simple_metadata(soup):
+    """Extract metadata from parsed simple HTML (single column, no sidebar)."""
 
     metadata = {
         "has_abstract": False,
@@ -451,7 +447,7 @@ def extract_html_simple_metadata(html_file):
                     metadata["themes_list"].append(curr.get_text(strip=True))
                 if curr.name == "p":
                     strong = curr.find("strong")
-                    if strong and re.match(r"\d+\.", curr.get_text(strip=True)):
+                    if strong and _NUMBERED_ITEM_RE.match(curr.get_text(strip=True)):
                         metadata["themes_list"].append(strong.get_text(strip=True))
                 curr = curr.find_next_sibling()
 
@@ -477,40 +473,14 @@ def extract_html_simple_metadata(html_file):
                 curr = curr.find_next_sibling()
 
     # Count highlights
-    bowen_marks = main_content.find_all("mark", class_="bowen-ref")
-    metadata["bowen_highlights"] = len(bowen_marks)
-
-    metadata["bowen_labels"] = []
-    for mark in bowen_marks:
-        title = mark.get("title", "")
-        if "Bowen Reference:" in title:
-            label = title.split("Bowen Reference:", 1)[1].strip()
-            metadata["bowen_labels"].append(label)
-
-    metadata["bowen_labels"] = [label.strip() for label in metadata["bowen_labels"]]
-    metadata["bowen_labels"] = split_multi_labels(metadata["bowen_labels"])
-
-    emphasis_marks = main_content.find_all("mark", class_="emphasis")
-    metadata["emphasis_highlights"] = len(emphasis_marks)
-
-    metadata["emphasis_labels"] = []
-    for mark in emphasis_marks:
-        title = mark.get("title", "")
-        if "Emphasized:" in title:
-            label = title.split("Emphasized:", 1)[1].split("|")[0].strip()
-            metadata["emphasis_labels"].append(label)
-
-    metadata["emphasis_labels"] = [
-        label.strip() for label in metadata["emphasis_labels"]
-    ]
+    _collect_highlights(main_content, metadata)
 
     return metadata
 
 
-def validate_css_definitions(html_file):
+def validate_css_definitions(soup):
     """Check if required CSS classes are defined in the style block."""
     try:
-        soup = BeautifulSoup(html_file.read_text(encoding="utf-8"), "html.parser")
         style = soup.find("style")
         if not style:
             return False, "No <style> block found"
@@ -545,42 +515,6 @@ def validate_css_definitions(html_file):
         return False, f"Error parsing CSS: {e}"
 
 
-def find_best_match_in_html(needle, haystack_normalized, threshold=0.85):
-    """
-    Find the best matching substring in normalized HTML content.
-    Returns (ratio, match_text).
-    """
-    needle_normalized = normalize_text(needle, aggressive=True)
-
-    if needle_normalized in haystack_normalized:
-        return (1.0, needle)
-
-    # Fuzzy match
-    needle_words = needle_normalized.split()
-    haystack_words = haystack_normalized.split()
-    needle_len = len(needle_words)
-
-    if needle_len > len(haystack_words):
-        return (0.0, None)
-
-    best_ratio = 0
-    best_match = None
-
-    # Optimization: Check window only if first word matches (optional, but speeds up large files)
-    # For now, we use standard sliding window
-    for i in range(len(haystack_words) - needle_len + 1):
-        window = " ".join(haystack_words[i : i + needle_len])
-        ratio = SequenceMatcher(None, needle_normalized, window).ratio()
-
-        if ratio > best_ratio:
-            best_ratio = ratio
-            best_match = window
-            if ratio > 0.98:  # Early exit
-                break
-
-    return (best_ratio, best_match)
-
-
 def _load_abstract_content(base_name):
     """Load abstract from generated file if available."""
     gen_file = (
@@ -638,12 +572,16 @@ def validate_webpage(base_name: str, simple_mode: bool = False) -> bool:
     issues = []
     warnings = []
 
+    # Read and parse the webpage once; every HTML check below shares it.
+    html_content = html_file.read_text(encoding="utf-8")
+    soup = BeautifulSoup(html_content, "html.parser")
+
     # 1. Section count validation
     print("📊 Section Count Validation")
     print("-" * 70)
 
     md_section_count, md_sections = count_sections_in_formatted(formatted_file)
-    html_section_count, html_sections = count_sections_in_html(html_file)
+    html_section_count, html_sections = count_sections_in_html(soup)
 
     print(f"   Formatted MD sections: {md_section_count}")
     print(f"   HTML sections:         {html_section_count}")
@@ -686,9 +624,9 @@ def validate_webpage(base_name: str, simple_mode: bool = False) -> bool:
 
     # Use appropriate extraction function based on mode
     if simple_mode:
-        html_meta = extract_html_simple_metadata(html_file)
+        html_meta = extract_html_simple_metadata(soup)
     else:
-        html_meta = extract_html_metadata(html_file)
+        html_meta = extract_html_metadata(soup)
 
     # Abstract
     print("   Abstract:")
@@ -769,7 +707,7 @@ def validate_webpage(base_name: str, simple_mode: bool = False) -> bool:
     print("-" * 70)
 
     # Check CSS definitions
-    css_ok, css_msg = validate_css_definitions(html_file)
+    css_ok, css_msg = validate_css_definitions(soup)
     if not css_ok:
         issues.append(f"CSS Validation failed: {css_msg}")
         print(f"   ❌ {css_msg}")
@@ -785,7 +723,7 @@ def validate_webpage(base_name: str, simple_mode: bool = False) -> bool:
     )
     print(f"      Highlighted: {bowen_label_count} references")
 
-    missing_bowen = find_missing_bowen_items(base_name, html_file)
+    missing_bowen = find_missing_bowen_items(real_bowen, soup)
 
     if source_meta["bowen_refs_count"] > 0 and bowen_label_count == 0:
         issues.append(
@@ -813,7 +751,7 @@ def validate_webpage(base_name: str, simple_mode: bool = False) -> bool:
     print(f"      Highlighted: {emphasis_label_count} items")
 
     # Check for missing emphasis items
-    missing_emphasis = find_missing_emphasis_items(base_name, html_file)
+    missing_emphasis = find_missing_emphasis_items(real_emphasis, soup)
 
     if source_meta["emphasis_count"] > 0 and emphasis_label_count == 0:
         issues.append(
@@ -851,18 +789,19 @@ def validate_webpage(base_name: str, simple_mode: bool = False) -> bool:
     print("\n🔍 Text Content Verification")
     print("-" * 70)
 
-    # Read and normalize HTML (stripping tags to check text presence)
-    html_content = html_file.read_text(encoding="utf-8")
+    # Normalize HTML (stripping tags to check text presence)
     html_normalized = normalize_text(html_content, aggressive=True)
 
     all_items = [
-        ("Bowen Ref", label, quote) for label, quote in load_bowen_references(base_name)
-    ] + [("Emphasis", label, quote) for label, quote in load_emphasis_items(base_name)]
+        ("Bowen Ref", label, quote) for label, quote in real_bowen
+    ] + [("Emphasis", label, quote) for label, quote in real_emphasis]
 
     text_missing_count = 0
     if all_items:
-        for type_, label, quote in all_items:
-            ratio, _ = find_best_match_in_html(quote, html_normalized, threshold=0.80)
+        matches = find_best_matches_in_html(
+            [quote for _, _, quote in all_items], html_normalized, threshold=0.80
+        )
+        for (type_, label, quote), (ratio, _) in zip(all_items, matches):
             if ratio < 0.85:
                 text_missing_count += 1
                 issues.append(f"Quote text missing for {type_}: {label}")
@@ -877,8 +816,6 @@ def validate_webpage(base_name: str, simple_mode: bool = False) -> bool:
     print("\n🔍 Metadata Content Verification (Sampling)")
     print("-" * 70)
 
-    import math
-
     # Verify Abstract content (full text since it's a single item)
     if source_meta["has_abstract"] and html_meta["has_abstract"]:
         # More robust comparison - normalize and compare full abstract
@@ -886,7 +823,10 @@ def validate_webpage(base_name: str, simple_mode: bool = False) -> bool:
         html_norm = normalize_for_comparison(html_meta["abstract_text"])
 
         # Check if content is substantially the same (allowing for minor differences)
-        ratio = SequenceMatcher(None, source_norm, html_norm).ratio()
+        if source_norm == html_norm:
+            ratio = 1.0
+        else:
+            ratio = SequenceMatcher(None, source_norm, html_norm).ratio()
 
         if ratio >= 0.95:  # 95% similarity is close enough
             print(f"   Abstract: ✅ Content matches ({ratio:.1%} similarity)")
@@ -900,14 +840,14 @@ def validate_webpage(base_name: str, simple_mode: bool = False) -> bool:
     if source_meta["topics_count"] > 0 and len(html_meta["topics_list"]) > 0:
         sample_size = math.ceil(source_meta["topics_count"] * 0.3)
         sample_indices = range(0, min(sample_size, len(source_meta["topics_list"])))
+        html_topics = [normalize_for_comparison(t) for t in html_meta["topics_list"]]
         matched = 0
         for idx in sample_indices:
             source_topic = normalize_for_comparison(source_meta["topics_list"][idx])
             # Check if any HTML topic matches
             found = any(
-                source_topic in normalize_for_comparison(html_topic)
-                or normalize_for_comparison(html_topic) in source_topic
-                for html_topic in html_meta["topics_list"]
+                source_topic in html_topic or html_topic in source_topic
+                for html_topic in html_topics
             )
             if found:
                 matched += 1
@@ -926,14 +866,14 @@ def validate_webpage(base_name: str, simple_mode: bool = False) -> bool:
     if source_meta["themes_count"] > 0 and len(html_meta["themes_list"]) > 0:
         sample_size = math.ceil(source_meta["themes_count"] * 0.3)
         sample_indices = range(0, min(sample_size, len(source_meta["themes_list"])))
+        html_themes = [normalize_for_comparison(t) for t in html_meta["themes_list"]]
         matched = 0
         for idx in sample_indices:
             source_theme = normalize_for_comparison(source_meta["themes_list"][idx])
             # Check if any HTML theme matches
             found = any(
-                source_theme in normalize_for_comparison(html_theme)
-                or normalize_for_comparison(html_theme) in source_theme
-                for html_theme in html_meta["themes_list"]
+                source_theme in html_theme or html_theme in source_theme
+                for html_theme in html_themes
             )
             if found:
                 matched += 1
@@ -952,14 +892,14 @@ def validate_webpage(base_name: str, simple_mode: bool = False) -> bool:
     if source_meta["key_terms_count"] > 0 and len(html_meta["key_terms_list"]) > 0:
         sample_size = math.ceil(source_meta["key_terms_count"] * 0.3)
         sample_indices = range(0, min(sample_size, len(source_meta["key_terms_list"])))
+        html_terms = [normalize_for_comparison(t) for t in html_meta["key_terms_list"]]
         matched = 0
         for idx in sample_indices:
             source_term = normalize_for_comparison(source_meta["key_terms_list"][idx])
             # Check if any HTML term matches
             found = any(
-                source_term in normalize_for_comparison(html_term)
-                or normalize_for_comparison(html_term) in source_term
-                for html_term in html_meta["key_terms_list"]
+                source_term in html_term or html_term in source_term
+                for html_term in html_terms
             )
             if found:
                 matched += 1
@@ -983,17 +923,16 @@ def validate_webpage(base_name: str, simple_mode: bool = False) -> bool:
         print("✅ ALL CHECKS PASSED - Webpage is complete and valid\n")
         return True
 
+    # Each list is written in one call rather than a print per entry.
     if issues:
-        print(f"❌ CRITICAL ISSUES FOUND: {len(issues)}")
-        for i, issue in enumerate(issues, 1):
-            print(f"   {i}. {issue}")
-        print()
+        lines = [f"❌ CRITICAL ISSUES FOUND: {len(issues)}"]
+        lines.extend(f"   {i}. {issue}" for i, issue in enumerate(issues, 1))
+        sys.stdout.write("\n".join(lines) + "\n\n")
 
     if warnings:
-        print(f"⚠️  WARNINGS: {len(warnings)}")
-        for i, warning in enumerate(warnings, 1):
-            print(f"   {i}. {warning}")
-        print()
+        lines = [f"⚠️  WARNINGS: {len(warnings)}"]
+        lines.extend(f"   {i}. {warning}" for i, warning in enumerate(warnings, 1))
+        sys.stdout.write("\n".join(lines) + "\n\n")
 
     return len(issues) == 0
 
@@ -1030,7 +969,9 @@ def main():
     )
     parser.add_argument(
         "base_name",
-        help='Base name of the transcript (e.g., "Title - Presenter - Date")',
+        nargs="+",
+        help='Base name of the transcript (e.g., "Title - Presenter - Date"); '
+        "several may be given",
     )
     parser.add_argument(
         "--simple",
@@ -1040,10 +981,10 @@ def main():
 
     args = parser.parse_args()
 
-    base_name = resolve_base_name(args.base_name)
+    base_names = [resolve_base_name(name) for name in args.base_name]
 
-    success = validate_webpage(base_name, simple_mode=args.simple)
-    exit(0 if success else 1)
+    results = [validate_webpage(name, simple_mode=args.simple) for name in base_names]
+    exit(0 if all(results) else 1)
 
 
 if __name__ == "__main__":
@@ -20,7 +20,8 @@ from transcript_utils import (
     create_system_message_with_cache,
     extract_emphasis_items,
     extract_section,
-    find_text_in_content,
+    find_text_in_normalized,
+    normalize_text,
     parse_scored_emphasis_output,
     parse_filename_metadata,
     setup_logging,
@@ -203,13 +204,21 @@ def _load_key_terms_for_validation(base_name: str) -> list[tuple[str, str]]:
 
 
 def validate_key_terms_fidelity(
-    formatted_file_path: Path, base_name: str, logger
+    formatted_file_path: Path,
+    base_name: str,
+    logger,
+    transcript: Optional[str] = None,
+    transcript_norm: Optional[str] = None,
 ) -> bool:
     """
     Validate key terms against transcript text and save a markdown report.
     Uses deterministic grounding checks (no API call).
+
+    transcript / transcript_norm may be passed by callers that already read
+    the formatted file (frontmatter stripped) and normalized it aggressively.
     """
-    transcript = strip_yaml_frontmatter(formatted_file_path.read_text(encoding="utf-8"))
+    if transcript is None:
+        transcript = strip_yaml_frontmatter(formatted_file_path.read_text(encoding="utf-8"))
     terms = _load_key_terms_for_validation(base_name)
 
     report_path = (
@@ -239,13 +248,16 @@ def validate_key_terms_fidelity(
         "|---|---:|---:|---|",
     ]
 
+    # Normalize the transcript once; every term is searched against it.
+    if transcript_norm is None:
+        transcript_norm = normalize_text(transcript, aggressive=True)
     for term, definition in terms:
-        term_ratio = find_text_in_content(
-            term, transcript, aggressive_normalization=True
+        term_ratio = find_text_in_normalized(
+            normalize_text(term, aggressive=True), transcript_norm
         )[2]
         def_probe = " ".join(definition.split()[:20])
-        def_ratio = find_text_in_content(
-            def_probe, transcript, aggressive_normalization=True
+        def_ratio = find_text_in_normalized(
+            normalize_text(def_probe, aggressive=True), transcript_norm
         )[2] if def_probe else 0.0
 
         if term_ratio >= 0.95 and def_ratio >= 0.90:
@@ -326,27 +338,33 @@ def _topic_keywords(text: str) -> list[str]:
     return [w for w in words if len(w) >= 4 and w not in stop]
 
 
-def _keyword_grounding_ratio(probe: str, haystack: str) -> float:
+def _keyword_grounding_ratio(probe: str, hay_words: set[str]) -> float:
     """
-    Compute lexical grounding as overlap of meaningful probe keywords in haystack.
-    Returns 0..1.
+    Compute lexical grounding as overlap of meaningful probe keywords in the
+    haystack keyword set (see _topic_keywords). Returns 0..1.
     """
     keywords = _topic_keywords(probe)
     if not keywords:
         return 0.0
-    hay_words = set(_topic_keywords(haystack))
     matched = sum(1 for w in set(keywords) if w in hay_words)
     return matched / max(1, len(set(keywords)))
 
 
 def validate_topics_lightweight(
-    formatted_file_path: Path, base_name: str, logger
+    formatted_file_path: Path,
+    base_name: str,
+    logger,
+    transcript: Optional[str] = None,
+    transcript_norm: Optional[str] = None,
 ) -> bool:
     """
     Lightweight deterministic topic validation.
     Checks topic title grounding and optional section-reference consistency.
+
+    transcript / transcript_norm are optional, as for validate_key_terms_fidelity.
     """
-    transcript = strip_yaml_frontmatter(formatted_file_path.read_text(encoding="utf-8"))
+    if transcript is None:
+        transcript = strip_yaml_frontmatter(formatted_file_path.read_text(encoding="utf-8"))
     topics = _load_topics_for_validation(base_name, transcript)
     sections_map = _extract_transcript_sections(transcript)
 
@@ -378,6 +396,10 @@ def validate_topics_lightweight(
         "|---|---:|---:|---:|---|",
     ]
 
+    # Normalize and tokenize the transcript once; every topic is checked against it.
+    if transcript_norm is None:
+        transcript_norm = normalize_text(transcript, aggressive=True)
+    transcript_words = set(_topic_keywords(transcript))
     for topic in topics:
         name = topic.get("name", "").strip()
         description = topic.get("description", "").strip()
@@ -385,17 +407,17 @@ def validate_topics_lightweight(
         if not name:
             continue
 
-        title_fuzzy = find_text_in_content(
-            name, transcript, aggressive_normalization=True
+        title_fuzzy = find_text_in_normalized(
+            normalize_text(name, aggressive=True), transcript_norm
         )[2]
-        title_ground = _keyword_grounding_ratio(name, transcript)
+        title_ground = _keyword_grounding_ratio(name, transcript_words)
         title_ratio = max(title_fuzzy, title_ground)
 
         desc_probe = " ".join(description.split()[:40])
-        desc_fuzzy = find_text_in_content(
-            desc_probe, transcript, aggressive_normalization=True
+        desc_fuzzy = find_text_in_normalized(
+            normalize_text(desc_probe, aggressive=True), transcript_norm
         )[2] if desc_probe else 0.0
-        desc_ground = _keyword_grounding_ratio(desc_probe, transcript) if desc_probe else 0.0
+        desc_ground = _keyword_grounding_ratio(desc_probe, transcript_words) if desc_probe else 0.0
         desc_ratio = max(desc_fuzzy, desc_ground)
 
         section_ratio = 0.0
@@ -404,7 +426,7 @@ def validate_topics_lightweight(
             section_text = " ".join(sections_map.get(n, "") for n in nums).strip()
             if section_text:
                 section_ratio = _keyword_grounding_ratio(
-                    f"{name} {desc_probe}", section_text
+                    f"{name} {desc_probe}", set(_topic_keywords(section_text))
                 )
             else:
                 section_ratio = 0.0
@@ -468,14 +490,15 @@ def validate_emphasis_items(
         return
 
     valid_count, partial_count, invalid_count = 0, 0, 0
+    formatted_norm = normalize_text(formatted_content, aggressive=True)
 
     for label, quote in quotes:
         # Use only first 15 words for fuzzy matching to avoid issues with long quotes
         quote_core = " ".join(quote.split()[:15])
 
         # Use shared utility instead of local _find_best_match
-        _, _, ratio = find_text_in_content(
-            quote_core, formatted_content, aggressive_normalization=True
+        _, _, ratio = find_text_in_normalized(
+            normalize_text(quote_core, aggressive=True), formatted_norm
         )
 
         if ratio >= 0.95: